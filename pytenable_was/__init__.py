@@ -14,36 +14,47 @@ __version__ = version("pytenable-was")
 
 
 # ---------------------------------------------------------------------------
-# Core infrastructure
+# Lazily imported public names (PEP 562)
+#
+# Importing the package (as the CLI does for __version__) does not pull in
+# requests or every API module; each name is imported on first access and
+# then cached in the module namespace.
 # ---------------------------------------------------------------------------
 
-from .http import HTTPClient
-from .config import Config
+from importlib import import_module
 
+_LAZY_ATTRS = {
+    # Core infrastructure
+    "HTTPClient": ".http",
+    # API modules
+    "ScansAPI": ".scans",
+    "FindingsAPI": ".findings",
+    "VulnsAPI": ".vulns",
+    "PluginsAPI": ".plugins",
+    "AsyncPluginsAPI": ".plugins",
+    "TemplatesAPI": ".templates",
+    "UserTemplatesAPI": ".user_templates",
+    "FoldersAPI": ".folders",
+    "NotesAPI": ".notes",
+    "FiltersAPI": ".filters",
+    # Utilities
+    "flatten_dict": ".utils",
+    "pretty_json": ".utils",
+}
 
-# ---------------------------------------------------------------------------
-# API modules
-# ---------------------------------------------------------------------------
 
-from .scans import ScansAPI
-from .findings import FindingsAPI
-from .vulns import VulnsAPI
-from .plugins import PluginsAPI
-from .templates import TemplatesAPI
-from .user_templates import UserTemplatesAPI
-from .folders import FoldersAPI
-from .filters import FiltersAPI
-from .notes import NotesAPI
+def __getattr__(name):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# ---------------------------------------------------------------------------
-# Utilities
-# ---------------------------------------------------------------------------
 
-from .utils import (
-    flatten_dict,
-    pretty_json,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 # ---------------------------------------------------------------------------
@@ -53,16 +64,16 @@ from .utils import (
 __all__ = [
     "__version__",
     "HTTPClient",
-    "Config",
     "ScansAPI",
     "FindingsAPI",
     "VulnsAPI",
     "PluginsAPI",
+    "AsyncPluginsAPI",
     "TemplatesAPI",
     "UserTemplatesAPI",
     "FoldersAPI",
-    "FiltersAPI",
     "NotesAPI",
+    "FiltersAPI",
     "flatten_dict",
     "pretty_json",
 ]
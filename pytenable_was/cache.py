@@ -0,0 +1,219 @@
+# pytenable_was/cache.py
+
+"""
+Caching helpers for the Tenable WAS v2 SDK.
+
+Two caches share one interface:
+
+    cache.get(namespace, key)              -> value (KeyError on miss/expiry)
+    cache.set(namespace, key, value, ttl)  -> None
+    cache.delete(namespace, key)
+    cache.clear(namespace=None)
+
+InMemoryCache
+    Per-process dict cache with optional per-entry TTL and optional LRU
+    size bound. Used by API modules to avoid repeat calls within one run.
+
+DiskCache
+    SQLite-backed cache that survives across CLI invocations. Intended
+    for data that does not change once final (e.g. findings of a
+    completed scan). Values are stored as JSON.
+"""
+
+import logging
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from .utils import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pytenable-was"
+CACHE_FILE = CACHE_DIR / "cache.sqlite3"
+
+
+# ======================================================================
+# IN-MEMORY CACHE
+# ======================================================================
+
+class InMemoryCache:
+    """
+    Thread-safe in-process cache keyed by (namespace, key).
+
+    With `maxsize`, the least recently used entries are evicted once the
+    cache holds more than `maxsize` entries (across all namespaces).
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[str, str], Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Any:
+        k = (namespace, key)
+        with self._lock:
+            expires, value = self._data[k]
+            if expires is not None and time.monotonic() >= expires:
+                del self._data[k]
+                raise KeyError(k)
+            self._data.move_to_end(k)
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        k = (namespace, key)
+        expires = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._data[k] = (expires, value)
+            self._data.move_to_end(k)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._data.pop((namespace, key), None)
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+            else:
+                for k in [k for k in self._data if k[0] == namespace]:
+                    del self._data[k]
+
+
+# ======================================================================
+# PERSISTENT (SQLITE) CACHE
+# ======================================================================
+
+class DiskCache:
+    """
+    Persistent cache stored in a single SQLite file (WAL mode).
+
+    The database is opened lazily on first use, so constructing a
+    DiskCache never touches the filesystem.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else CACHE_FILE
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _secure_path(self) -> None:
+        # Cached responses can hold scan data: keep the directory 0700 and
+        # the database 0600. SQLite gives -wal/-shm the mode of the main
+        # file, so creating it 0600 before connecting covers those too.
+        self.path.parent.mkdir(mode=stat.S_IRWXU, parents=True, exist_ok=True)
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, stat.S_IRUSR | stat.S_IWUSR))
+
+        # best-effort chmod for files created before this, or under a
+        # umask/filesystem that ignored the create mode
+        targets = [(self.path.parent, stat.S_IRWXU)] + [
+            (Path(f"{self.path}{suffix}"), stat.S_IRUSR | stat.S_IWUSR)
+            for suffix in ("", "-wal", "-shm")
+        ]
+        for target, mode in targets:
+            try:
+                if stat.S_IMODE(os.stat(target).st_mode) != mode:
+                    os.chmod(target, mode)
+            except OSError:
+                pass
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._secure_path()
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " blob BLOB NOT NULL,"
+                " mtime REAL NOT NULL,"
+                " expires REAL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, namespace: str, key: str, stale: bool = False) -> Any:
+        """
+        Return the cached value. Expired entries raise KeyError unless
+        `stale=True`; they are kept (until overwritten or cleared) so a
+        caller can fall back to them when a refresh fails.
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT blob, expires FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+
+        if row is None:
+            raise KeyError((namespace, key))
+
+        blob, expires = row
+        if not stale and expires is not None and time.time() >= expires:
+            raise KeyError((namespace, key))
+
+        return json_loads(blob)
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = time.time()
+        blob = json_dumps(value).encode("utf-8")
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, blob, mtime, expires)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, blob, now, now + ttl if ttl else None),
+            )
+            conn.commit()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+            conn.commit()
+
+    def prune(self, namespace: str, max_entries: int) -> None:
+        """
+        Keep only the `max_entries` most recently written entries of
+        `namespace`; older ones are deleted.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key NOT IN ("
+                " SELECT key FROM cache WHERE namespace = ?"
+                " ORDER BY mtime DESC LIMIT ?)",
+                (namespace, namespace, max_entries),
+            )
+            conn.commit()
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        with self._lock:
+            conn = self._connect()
+            if namespace is None:
+                conn.execute("DELETE FROM cache")
+            else:
+                conn.execute("DELETE FROM cache WHERE namespace = ?", (namespace,))
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
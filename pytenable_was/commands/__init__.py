@@ -0,0 +1,9 @@
+# pytenable_was/commands/__init__.py
+
+"""
+CLI command groups for pytenable-was.
+
+Each module in this package defines one Click group. The root CLI
+(cli.py) registers them by name only and imports a module the first
+time its group is dispatched.
+"""
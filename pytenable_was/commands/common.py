@@ -0,0 +1,136 @@
+# pytenable_was/commands/common.py
+
+"""
+Helpers shared by the CLI command groups.
+"""
+
+import itertools
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import click
+
+from ..config import load_config
+
+def _proxy_dict_from_config(cfg: dict) -> Optional[dict]:
+    proxy_url = cfg.get("proxy_url")
+    if not proxy_url:
+        return None
+
+    if cfg.get("proxy_auth"):
+        user = cfg.get("proxy_username")
+        pw = cfg.get("proxy_password")
+        if not user or not pw:
+            raise click.ClickException(
+                "Proxy authentication enabled but credentials missing."
+            )
+
+        if "://" not in proxy_url:
+            raise click.ClickException("Proxy URL must start with http:// or https://")
+
+        scheme, rest = proxy_url.split("://", 1)
+        proxy_url = f"{scheme}://{user}:{pw}@{rest}"
+
+    return {"http": proxy_url, "https": proxy_url}
+
+
+# Key under which the invocation's shared HTTPClient is kept in ctx.meta
+_HTTP_META_KEY = "pytenable_was.http"
+
+# Default (connect, read) timeouts in seconds. A hung TCP/TLS handshake
+# fails after the short connect timeout instead of holding a worker for the
+# full budget; the read timeout bounds the gap between received bytes, not
+# the whole transfer, so long exports are unaffected.
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+
+def _timeout_options(func):
+    func = click.option("--read-timeout", default=DEFAULT_READ_TIMEOUT, show_default=True,
+                        type=click.FloatRange(min=0, min_open=True),
+                        help="Seconds to wait for response data.")(func)
+    func = click.option("--connect-timeout", default=DEFAULT_CONNECT_TIMEOUT, show_default=True,
+                        type=click.FloatRange(min=0, min_open=True),
+                        help="Seconds to wait for a connection.")(func)
+    return func
+
+
+def _load_http_from_config(timeout: Optional[Tuple[float, float]] = None):
+    """
+    Return the HTTPClient for the current CLI invocation.
+
+    The client (and its connection pool) is built once per invocation and
+    stored on the root click context, so every API wrapper a command uses
+    shares it; it is closed when the context tears down. Outside a click
+    context a fresh client is returned.
+
+    `timeout` is a (connect, read) tuple, as produced by _timeout_options;
+    it is applied to the shared client even if it already exists.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return _build_http_from_config(timeout)
+
+    root = ctx.find_root()
+    http = root.meta.get(_HTTP_META_KEY)
+    if http is None:
+        http = root.meta[_HTTP_META_KEY] = _build_http_from_config(timeout)
+        root.call_on_close(http.close)
+    elif timeout is not None:
+        http.timeout = timeout
+    return http
+
+
+def _build_http_from_config(timeout: Optional[Tuple[float, float]] = None):
+    # Imported here so that `--help` and `config` never pay for requests.
+    from ..http import HTTPClient
+
+    cfg = load_config()
+    api_key = cfg.get("api_key")
+
+    if not api_key:
+        raise click.ClickException(
+            "API key not configured. Run: pytenable-was config set-key"
+        )
+
+    proxies = _proxy_dict_from_config(cfg)
+
+    return HTTPClient(
+        api_key=api_key,
+        proxies=proxies,
+        timeout=timeout or (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        http2=bool(cfg.get("http2")),
+    )
+
+
+def _split_ids(text: str) -> List[str]:
+    # IDs are separated by commas and/or any whitespace (including newlines).
+    # str.split() with no argument drops empty tokens and runs in C; it is
+    # several times faster than a regex split on large ID dumps.
+    return text.replace(",", " ").split()
+
+
+def _parse_ids(ids: str) -> List[str]:
+    return _split_ids(ids)
+
+
+def _load_ids_from_file(path: str) -> List[str]:
+    p = Path(path)
+    if not p.exists():
+        raise click.ClickException(f"File not found: {path}")
+
+    return _split_ids(p.read_text(encoding="utf-8"))
+
+
+# Lines per write in _echo_lines
+_ECHO_CHUNK = 1024
+
+
+def _echo_lines(lines: Iterable[str]) -> None:
+    """
+    click.echo each line, batched into one write per _ECHO_CHUNK lines
+    instead of one write (and flush) per line.
+    """
+    it = iter(lines)
+    for chunk in iter(lambda: list(itertools.islice(it, _ECHO_CHUNK)), []):
+        click.echo("\n".join(chunk))
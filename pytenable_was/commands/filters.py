@@ -0,0 +1,52 @@
+# pytenable_was/commands/filters.py
+
+"""
+WAS filter metadata commands.
+"""
+
+import click
+
+from ..filters import FiltersAPI
+from ..utils import pretty_json
+from .common import _load_http_from_config
+
+
+@click.group()
+def filters():
+    """WAS filter metadata."""
+    pass
+
+
+@filters.command("scan-configs")
+def filters_scan_configs():
+    http = _load_http_from_config()
+    api = FiltersAPI(http)
+    click.echo(pretty_json(api.scan_configs_filters()))
+
+
+@filters.command("scans")
+def filters_scans():
+    http = _load_http_from_config()
+    api = FiltersAPI(http)
+    click.echo(pretty_json(api.scans_filters()))
+
+
+@filters.command("user-templates")
+def filters_user_templates():
+    http = _load_http_from_config()
+    api = FiltersAPI(http)
+    click.echo(pretty_json(api.user_templates_filters()))
+
+
+@filters.command("vulns")
+def filters_vulns():
+    http = _load_http_from_config()
+    api = FiltersAPI(http)
+    click.echo(pretty_json(api.vulns_filters()))
+
+
+@filters.command("vulns-scan")
+def filters_vulns_scan():
+    http = _load_http_from_config()
+    api = FiltersAPI(http)
+    click.echo(pretty_json(api.vulns_scan_filters()))
@@ -0,0 +1,97 @@
+# pytenable_was/commands/findings.py
+
+"""
+WAS findings export commands.
+"""
+
+import click
+
+from ..cache import DiskCache
+from ..scans import ScansAPI
+from ..findings import FindingsAPI
+from ..utils import timestamp_filename
+from .common import _load_http_from_config, _timeout_options
+
+
+def _findings_api(no_cache: bool, timeout=None) -> FindingsAPI:
+    http = _load_http_from_config(timeout=timeout)
+    return FindingsAPI(
+        http=http,
+        scans_api=ScansAPI(http),
+        disk_cache=None if no_cache else DiskCache(),
+    )
+
+
+@click.group()
+def findings():
+    """Export WAS findings."""
+    pass
+
+
+@findings.command("export")
+@click.argument("scan_id")
+@click.option("--json-out")
+@click.option("--jsonl-out", help="JSON Lines: one finding per line.")
+@click.option("--csv-out")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk findings cache.")
+@click.option("--raw", is_flag=True, help="Write the API response to --json-out verbatim (streamed).")
+def findings_export(scan_id, json_out, jsonl_out, csv_out, no_cache, raw):
+    """Export full findings for a single scan via /export/findings."""
+    if not json_out and not jsonl_out and not csv_out:
+        csv_out = "auto"
+
+    api = _findings_api(no_cache)
+
+    if json_out:
+        export = api.export_findings_raw if raw else api.export_findings_json
+        out_path = export(scan_id, None if json_out == "auto" else json_out)
+        click.echo(f"Findings JSON written: {out_path}")
+
+    if jsonl_out:
+        out_path = api.export_findings_jsonl(scan_id, None if jsonl_out == "auto" else jsonl_out)
+        click.echo(f"Findings JSONL written: {out_path}")
+
+    if csv_out:
+        out_path = api.export_findings_csv(
+            scan_id, None if csv_out == "auto" else csv_out
+        )
+        click.echo(f"Findings CSV written: {out_path}")
+
+
+@findings.command("export-all")
+@click.option("--json-out")
+@click.option("--jsonl-out", help="JSON Lines: one finding (with scan_id) per line.")
+@click.option("--csv-out")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk findings cache.")
+@click.option("--concurrency", default=8, show_default=True, type=click.IntRange(min=1),
+              help="Scans exported in parallel.")
+@_timeout_options
+def findings_export_all(json_out, jsonl_out, csv_out, no_cache, concurrency, connect_timeout, read_timeout):
+    """Export ALL findings across ALL scans."""
+    if not json_out and not jsonl_out and not csv_out:
+        csv_out = "auto"
+
+    api = _findings_api(no_cache, timeout=(connect_timeout, read_timeout))
+
+    json_path = jsonl_path = csv_path = None
+    if json_out:
+        json_path = timestamp_filename(prefix="findings_all", ext="json") if json_out == "auto" else json_out
+    if jsonl_out:
+        jsonl_path = timestamp_filename(prefix="findings_all", ext="jsonl") if jsonl_out == "auto" else jsonl_out
+    if csv_out:
+        csv_path = timestamp_filename(prefix="findings_all", ext="csv") if csv_out == "auto" else csv_out
+
+    # each scan exported once, fanned out to every requested file
+    api.export_all_findings_files(
+        json_path=json_path,
+        jsonl_path=jsonl_path,
+        csv_path=csv_path,
+        max_workers=concurrency,
+    )
+
+    if json_path:
+        click.echo(f"All findings JSON written: {json_path}")
+    if jsonl_path:
+        click.echo(f"All findings JSONL written: {jsonl_path}")
+    if csv_path:
+        click.echo(f"All findings CSV written: {csv_path}")
@@ -0,0 +1,26 @@
+# pytenable_was/commands/folders.py
+
+"""
+WAS folder commands.
+"""
+
+import click
+
+from ..folders import FoldersAPI
+from .common import _echo_lines, _load_http_from_config
+
+
+@click.group()
+def folders():
+    """WAS folders."""
+    pass
+
+
+@folders.command("list")
+def folders_list():
+    http = _load_http_from_config()
+    api = FoldersAPI(http)
+    _echo_lines(
+        f"{f.get('folder_id') or f.get('id')}\t{f.get('name', '')}"
+        for f in api.list_folders()
+    )
@@ -0,0 +1,105 @@
+# pytenable_was/commands/notes.py
+
+"""
+WAS scan notes commands.
+"""
+
+from collections import Counter
+
+import click
+
+from ..cache import DiskCache
+from ..notes import NotesAPI
+from ..scans import ScansAPI
+from ..utils import (
+    prefetch,
+    timestamp_filename,
+    write_csv_spooled,
+    write_json_csv_stream,
+    write_json_stream,
+)
+from .common import (
+    _echo_lines,
+    _load_http_from_config,
+    _load_ids_from_file,
+    _parse_ids,
+)
+
+
+def _notes_api(no_cache: bool) -> NotesAPI:
+    http = _load_http_from_config()
+    if no_cache:
+        return NotesAPI(http)
+    return NotesAPI(http, disk_cache=DiskCache(), scans_api=ScansAPI(http))
+
+
+@click.group()
+def notes():
+    """WAS scan notes."""
+    pass
+
+
+@notes.command("list")
+@click.argument("scan_id")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk notes cache.")
+def notes_list(scan_id, no_cache):
+    api = _notes_api(no_cache)
+    _echo_lines(
+        f"{n.get('scan_note_id') or n.get('id')}\t{n.get('severity', '')}\t{n.get('title', '')}"
+        for n in api.list_notes(scan_id)
+    )
+
+
+@notes.command("export")
+@click.argument("scan_ids", required=False)
+@click.option("--from-file", "ids_file")
+@click.option("--json-out")
+@click.option("--csv-out")
+@click.option("--no-cache", is_flag=True, help="Bypass the on-disk notes cache.")
+def notes_export(scan_ids, ids_file, json_out, csv_out, no_cache):
+    """
+    Export notes for one or more scans.
+
+    Provide scan_ids separated by commas and/or whitespace, or use
+    --from-file with a file of IDs (same separators, e.g. one per line).
+    """
+    if bool(scan_ids) == bool(ids_file):
+        raise click.ClickException("Provide scan_ids OR --from-file")
+
+    ids = _parse_ids(scan_ids) if scan_ids else _load_ids_from_file(ids_file)
+    if not ids:
+        raise click.ClickException("No scan IDs provided.")
+
+    if not json_out and not csv_out:
+        csv_out = "auto"
+
+    json_path = csv_path = None
+    if json_out:
+        json_path = timestamp_filename(prefix="notes", ext="json") if json_out == "auto" else json_out
+    if csv_out:
+        csv_path = timestamp_filename(prefix="notes", ext="csv") if csv_out == "auto" else csv_out
+
+    api = _notes_api(no_cache)
+
+    # Fetch scan N+1 in the background while scan N is written; severities
+    # are counted as rows stream past, so the summary costs no extra pass.
+    counts = Counter()
+    pages = prefetch(api.stream_notes(ids, counts=counts))
+
+    if json_path and csv_path:
+        write_json_csv_stream(json_path, csv_path, pages, trailing=("scan_id",))
+    elif json_path:
+        write_json_stream(json_path, pages)
+    else:
+        write_csv_spooled(csv_path, (r for p in pages for r in p), trailing=("scan_id",))
+
+    if json_path:
+        click.echo(f"Notes JSON written: {json_path}")
+    if csv_path:
+        click.echo(f"Notes CSV written: {csv_path}")
+
+    summary = api.summarize_counts(counts)
+    click.echo(
+        f"{summary['total']} notes: "
+        + ", ".join(f"{sev} {summary[sev]}" for sev in ("critical", "high", "medium", "low", "info"))
+    )
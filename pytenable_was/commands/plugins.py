@@ -0,0 +1,175 @@
+# pytenable_was/commands/plugins.py
+
+"""
+WAS plugin metadata commands.
+"""
+
+import click
+
+from ..cache import DiskCache
+from ..plugins import PluginsAPI
+from ..utils import (
+    _import_pyarrow,
+    extend_columns,
+    pretty_json,
+    prefetch,
+    tee_jsonl,
+    write_csv_safe,
+    write_csv_spooled,
+    write_json_csv_stream,
+    write_json_safe,
+    write_json_stream,
+    write_jsonl_stream,
+    write_parquet_columns,
+    timestamp_filename,
+)
+from .common import (
+    _echo_lines,
+    _load_http_from_config,
+    _parse_ids,
+)
+
+
+def _plugins_api(no_cache: bool, refresh_cache: bool) -> PluginsAPI:
+    http = _load_http_from_config()
+    return PluginsAPI(
+        http,
+        disk_cache=None if no_cache else DiskCache(),
+        refresh=refresh_cache,
+    )
+
+
+def _cache_options(func):
+    func = click.option("--refresh-cache", is_flag=True, help="Re-fetch plugin metadata and update the cache.")(func)
+    func = click.option("--no-cache", is_flag=True, help="Bypass the on-disk plugin cache.")(func)
+    return func
+
+
+@click.group()
+def plugins():
+    """WAS plugin metadata."""
+    pass
+
+
+@plugins.command("list")
+@_cache_options
+def plugins_list(no_cache, refresh_cache):
+    api = _plugins_api(no_cache, refresh_cache)
+    # printed page by page while the next page is fetched in the background
+    for page in prefetch(api.iter_plugin_pages()):
+        _echo_lines(
+            f"{p.get('plugin_id') or p.get('id')}\t{p.get('risk_factor', '')}\t{p.get('name', '')}"
+            for p in page
+        )
+
+
+@plugins.command("get")
+@click.argument("plugin_id")
+@_cache_options
+def plugins_get(plugin_id, no_cache, refresh_cache):
+    api = _plugins_api(no_cache, refresh_cache)
+    click.echo(pretty_json(api.get_plugin(plugin_id)))
+
+
+@plugins.command("export")
+@click.argument("plugin_ids")
+@click.option("--json-out")
+@click.option("--jsonl-out", help="JSON Lines: one plugin per line.")
+@click.option("--csv-out")
+@_cache_options
+def plugins_export(plugin_ids, json_out, jsonl_out, csv_out, no_cache, refresh_cache):
+    """Export one or more plugins (comma-separated IDs)."""
+    if not json_out and not jsonl_out and not csv_out:
+        csv_out = "auto"
+
+    ids = _parse_ids(plugin_ids)
+    if not ids:
+        raise click.ClickException("No plugin IDs provided.")
+
+    api = _plugins_api(no_cache, refresh_cache)
+
+    rows = api.flatten_multiple(ids) if len(ids) > 1 else [api.flatten_single(ids[0])]
+
+    if json_out:
+        path = timestamp_filename(prefix="plugins", ext="json") if json_out == "auto" else json_out
+        write_json_safe(path, rows)
+        click.echo(f"Plugins JSON written: {path}")
+
+    if jsonl_out:
+        path = timestamp_filename(prefix="plugins", ext="jsonl") if jsonl_out == "auto" else jsonl_out
+        write_jsonl_stream(path, [rows])
+        click.echo(f"Plugins JSONL written: {path}")
+
+    if csv_out:
+        path = timestamp_filename(prefix="plugins", ext="csv") if csv_out == "auto" else csv_out
+        write_csv_safe(path, rows)
+        click.echo(f"Plugins CSV written: {path}")
+
+
+@plugins.command("export-all")
+@click.option("--json-out")
+@click.option("--jsonl-out", help="JSON Lines: one plugin per line.")
+@click.option("--csv-out")
+@click.option("--parquet-out", help="Also write a Parquet file (requires pyarrow).")
+@_cache_options
+def plugins_export_all(json_out, jsonl_out, csv_out, parquet_out, no_cache, refresh_cache):
+    """Export ALL plugins."""
+    if not json_out and not jsonl_out and not csv_out and not parquet_out:
+        csv_out = "auto"
+
+    if parquet_out:
+        # fail before fetching the catalog, not after
+        try:
+            _import_pyarrow()
+        except ImportError as exc:
+            raise click.ClickException(str(exc)) from exc
+
+    api = _plugins_api(no_cache, refresh_cache)
+
+    json_path = jsonl_path = csv_path = parquet_path = None
+    if json_out:
+        json_path = timestamp_filename(prefix="plugins_all", ext="json") if json_out == "auto" else json_out
+    if jsonl_out:
+        jsonl_path = timestamp_filename(prefix="plugins_all", ext="jsonl") if jsonl_out == "auto" else jsonl_out
+    if csv_out:
+        csv_path = timestamp_filename(prefix="plugins_all", ext="csv") if csv_out == "auto" else csv_out
+    if parquet_out:
+        parquet_path = (
+            timestamp_filename(prefix="plugins_all", ext="parquet") if parquet_out == "auto" else parquet_out
+        )
+
+    # Fetch page N+1 in the background while page N is flattened + written.
+    pages = prefetch(api.iter_flatten_all())
+
+    columns = {}
+    if parquet_path:
+        pages = _collect_columns(pages, columns)
+    if jsonl_path:
+        pages = tee_jsonl(jsonl_path, pages)
+
+    if json_path and csv_path:
+        write_json_csv_stream(json_path, csv_path, pages)
+    elif json_path:
+        write_json_stream(json_path, pages)
+    elif csv_path:
+        write_csv_spooled(csv_path, (row for page in pages for row in page))
+    else:
+        for _ in pages:
+            pass
+
+    if json_path:
+        click.echo(f"All plugins JSON written: {json_path}")
+    if jsonl_path:
+        click.echo(f"All plugins JSONL written: {jsonl_path}")
+    if csv_path:
+        click.echo(f"All plugins CSV written: {csv_path}")
+    if parquet_path:
+        write_parquet_columns(parquet_path, columns)
+        click.echo(f"All plugins Parquet written: {parquet_path}")
+
+
+def _collect_columns(pages, columns):
+    """Pass pages through unchanged while appending their rows to `columns`."""
+    for page in pages:
+        extend_columns(columns, page)
+        yield page
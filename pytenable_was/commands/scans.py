@@ -0,0 +1,90 @@
+# pytenable_was/commands/scans.py
+
+"""
+WAS scan commands.
+"""
+
+import click
+
+from ..scans import ScansAPI
+from ..utils import prefetch, pretty_json
+from .common import (
+    _echo_lines,
+    _load_http_from_config,
+    _load_ids_from_file,
+    _parse_ids,
+    _timeout_options,
+)
+
+
+@click.group()
+def scans():
+    """Manage WAS scans."""
+    pass
+
+
+@scans.command("list")
+def scans_list():
+    http = _load_http_from_config()
+    api = ScansAPI(http)
+
+    # printed page by page while the next page is fetched in the background
+    for page in prefetch(api.iter_scan_pages()):
+        _echo_lines(
+            f"{s.get('scan_id') or s.get('id')}\t{s.get('status', '')}\t{s.get('name', '')}"
+            for s in page
+        )
+
+
+@scans.command("details")
+@click.argument("scan_id")
+def scans_details(scan_id):
+    http = _load_http_from_config()
+    api = ScansAPI(http)
+    click.echo(pretty_json(api.get_scan(scan_id)))
+
+
+@scans.command("set-owner")
+@click.argument("scan_id")
+@click.option("--user-id", required=True)
+def scans_set_owner(scan_id, user_id):
+    """Change owner of a single scan."""
+    http = _load_http_from_config()
+    api = ScansAPI(http)
+    api.change_owner(scan_id, user_id)
+    click.echo(f"Owner updated for scan {scan_id} -> {user_id}")
+
+
+@scans.command("set-owner-bulk")
+@click.argument("scan_ids", required=False)
+@click.option("--from-file", "ids_file")
+@click.option("--user-id", required=True)
+@click.option("--concurrency", default=16, show_default=True, type=click.IntRange(min=1),
+              help="Owner changes sent in parallel.")
+@_timeout_options
+def scans_set_owner_bulk(scan_ids, ids_file, user_id, concurrency, connect_timeout, read_timeout):
+    """
+    Change owner for many scans.
+
+    Provide scan_ids separated by commas and/or whitespace, or use
+    --from-file with a file of IDs (same separators, e.g. one per line).
+    """
+    if bool(scan_ids) == bool(ids_file):
+        raise click.ClickException("Provide scan_ids OR --from-file")
+
+    ids = _parse_ids(scan_ids) if scan_ids else _load_ids_from_file(ids_file)
+    if not ids:
+        raise click.ClickException("No scan IDs provided.")
+
+    http = _load_http_from_config(timeout=(connect_timeout, read_timeout))
+    api = ScansAPI(http)
+
+    results = api.change_owner_bulk(ids, user_id, max_workers=concurrency)
+    failed = [r for r in results if r["status"] != "ok"]
+
+    for r in failed:
+        click.echo(f"Failed {r['scan_id']}: {r['error']}", err=True)
+
+    click.echo(f"Updated owner for {len(ids) - len(failed)} scans -> {user_id}")
+    if failed:
+        raise click.ClickException(f"{len(failed)} of {len(ids)} scans could not be updated.")
@@ -0,0 +1,26 @@
+# pytenable_was/commands/templates.py
+
+"""
+Tenable-provided WAS template commands.
+"""
+
+import click
+
+from ..templates import TemplatesAPI
+from .common import _echo_lines, _load_http_from_config
+
+
+@click.group()
+def templates():
+    """Tenable-provided WAS templates."""
+    pass
+
+
+@templates.command("list")
+def templates_list():
+    http = _load_http_from_config()
+    api = TemplatesAPI(http)
+    _echo_lines(
+        f"{t.get('template_id') or t.get('id')}\t{t.get('name', '')}"
+        for t in api.list_all()
+    )
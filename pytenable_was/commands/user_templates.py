@@ -0,0 +1,26 @@
+# pytenable_was/commands/user_templates.py
+
+"""
+User-defined WAS template commands.
+"""
+
+import click
+
+from ..user_templates import UserTemplatesAPI
+from .common import _echo_lines, _load_http_from_config
+
+
+@click.group(name="user-templates")
+def user_templates():
+    """User-defined WAS templates."""
+    pass
+
+
+@user_templates.command("list")
+def user_templates_list():
+    http = _load_http_from_config()
+    api = UserTemplatesAPI(http)
+    _echo_lines(
+        f"{t.get('user_template_id') or t.get('id')}\t{t.get('name', '')}"
+        for t in api.list_user_templates()
+    )
@@ -0,0 +1,67 @@
+# pytenable_was/commands/vulns.py
+
+"""
+WAS vulnerability commands.
+"""
+
+import click
+
+from ..vulns import VulnsAPI
+from ..utils import pretty_json, timestamp_filename
+from .common import _load_http_from_config, _timeout_options
+
+
+@click.group()
+def vulns():
+    """WAS vulnerabilities."""
+    pass
+
+
+@vulns.command("get")
+@click.argument("vuln_id")
+def vulns_get(vuln_id):
+    """Get vulnerability details."""
+    http = _load_http_from_config()
+    api = VulnsAPI(http)
+    click.echo(pretty_json(api.get_vuln(vuln_id)))
+
+
+@vulns.command("export-all")
+@click.option("--query", default="*")
+@click.option("--json-out")
+@click.option("--jsonl-out", help="JSON Lines: one vulnerability per line.")
+@click.option("--csv-out")
+@click.option("--concurrency", default=8, show_default=True, type=click.IntRange(min=1),
+              help="Result pages fetched in parallel.")
+@_timeout_options
+def vulns_export_all(query, json_out, jsonl_out, csv_out, concurrency, connect_timeout, read_timeout):
+    """Export ALL vulnerabilities matching the query (default: all)."""
+    if not json_out and not jsonl_out and not csv_out:
+        csv_out = "auto"
+
+    http = _load_http_from_config(timeout=(connect_timeout, read_timeout))
+    api = VulnsAPI(http)
+
+    json_path = jsonl_path = csv_path = None
+    if json_out:
+        json_path = timestamp_filename(prefix="vulns_all", ext="json") if json_out == "auto" else json_out
+    if jsonl_out:
+        jsonl_path = timestamp_filename(prefix="vulns_all", ext="jsonl") if jsonl_out == "auto" else jsonl_out
+    if csv_out:
+        csv_path = timestamp_filename(prefix="vulns_all", ext="csv") if csv_out == "auto" else csv_out
+
+    # one search, fanned out to every requested file
+    api.export_all_vulns(
+        query,
+        json_path=json_path,
+        jsonl_path=jsonl_path,
+        csv_path=csv_path,
+        max_workers=concurrency,
+    )
+
+    if json_path:
+        click.echo(f"All vulns JSON written: {json_path}")
+    if jsonl_path:
+        click.echo(f"All vulns JSONL written: {jsonl_path}")
+    if csv_path:
+        click.echo(f"All vulns CSV written: {csv_path}")
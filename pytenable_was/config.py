@@ -10,14 +10,21 @@ Supports:
     - API key storage (masked on display)
     - Optional proxy configuration
     - Optional proxy authentication
+    - Optional HTTP/2 transport (requires the `http2` extra)
 """
 
 import json
+import os
 import stat
 from pathlib import Path
 from getpass import getpass
 import click
 
+try:
+    import orjson
+except ImportError:  # optional accelerator (`fast` extra)
+    orjson = None
+
 # ---------------------------------------------------------------------
 # Paths
 # ---------------------------------------------------------------------
@@ -36,6 +43,7 @@ def _default_config() -> dict:
         "proxy_auth": False,
         "proxy_username": None,
         "proxy_password": None,
+        "http2": False,
     }
 
 # ---------------------------------------------------------------------
@@ -46,37 +54,87 @@ def _ensure_config_dir():
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_config() -> dict:
-    _ensure_config_dir()
+# Parsed config keyed by the file's (mtime_ns, size); reset by save_config
+_cache = {"stamp": None, "cfg": None}
 
-    if not CONFIG_FILE.exists():
-        return _default_config()
 
+def load_config() -> dict:
+    """
+    Return the stored configuration (defaults if missing or unreadable).
+
+    The parsed file is reused until its mtime/size change, so repeated
+    calls within one process cost a stat(). Callers get their own copy
+    and may modify it freely. Reading never creates the config directory;
+    save_config does that on the first write.
+    """
     try:
-        return json.loads(CONFIG_FILE.read_text())
-    except Exception:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
         return _default_config()
 
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _cache["stamp"] != stamp:
+        try:
+            data = CONFIG_FILE.read_bytes()
+            cfg = orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception:
+            return _default_config()
+        _cache.update(stamp=stamp, cfg=cfg)
+
+    return dict(_cache["cfg"])
+
 
 def save_config(cfg: dict):
     _ensure_config_dir()
 
     tmp = CONFIG_FILE.with_suffix(".tmp")
-    tmp.write_text(json.dumps(cfg, indent=2))
-    tmp.replace(CONFIG_FILE)
 
-    # best-effort chmod 600
+    # stale temp file from an interrupted save
+    try:
+        tmp.unlink()
+    except FileNotFoundError:
+        pass
+
+    # created 0600 up front: no window where the key is world-readable
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, stat.S_IRUSR | stat.S_IWUSR)
+    if orjson is not None:
+        data = orjson.dumps(cfg, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(cfg, indent=2).encode("utf-8")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp, CONFIG_FILE)
+    _cache["stamp"] = None
+
+    # best-effort chmod 600 (only needed where the create mode is ignored)
     try:
-        CONFIG_FILE.chmod(stat.S_IRUSR | stat.S_IWUSR)
+        if stat.S_IMODE(os.stat(CONFIG_FILE).st_mode) != 0o600:
+            CONFIG_FILE.chmod(stat.S_IRUSR | stat.S_IWUSR)
     except Exception:
         pass
 
 
-def _validate_proxy_url(url: str):
-    if not url.startswith(("http://", "https://")):
-        raise click.ClickException(
-            "Proxy URL must start with http:// or https://"
-        )
+def _normalize_proxy_url(url: str) -> str:
+    """
+    Return `url` stripped, with its scheme lowercased ("HTTP://" -> "http://").
+    Only the scheme is touched; host, port and path keep their case.
+    """
+    u = url.strip()
+    if u.startswith(("http://", "https://")):
+        return u
+
+    lo = u[:8].lower()
+    if lo.startswith("http://"):
+        return "http://" + u[7:]
+    if lo.startswith("https://"):
+        return "https://" + u[8:]
+
+    raise click.ClickException(
+        "Proxy URL must start with http:// or https://"
+    )
 
 # ---------------------------------------------------------------------
 # Click command group
@@ -98,6 +156,7 @@ def config_show():
     click.echo(f"  API Key:        {'****' if cfg['api_key'] else '(not set)'}")
     click.echo(f"  Proxy URL:      {cfg['proxy_url'] or '(none)'}")
     click.echo(f"  Proxy Auth:     {'enabled' if cfg['proxy_auth'] else 'disabled'}")
+    click.echo(f"  HTTP/2:         {'enabled' if cfg.get('http2') else 'disabled'}")
     click.echo(f"  Config File:    {CONFIG_FILE}")
 
 # ---------------------------------------------------------------------
@@ -136,7 +195,7 @@ def config_clear_key():
 @config.command("set-proxy")
 @click.argument("url")
 def config_set_proxy(url: str):
-    _validate_proxy_url(url)
+    url = _normalize_proxy_url(url)
 
     cfg = load_config()
     cfg["proxy_url"] = url
@@ -193,6 +252,19 @@ def config_clear_proxy_auth():
 
     click.echo("Proxy authentication disabled.")
 
+# ---------------------------------------------------------------------
+# Transport
+# ---------------------------------------------------------------------
+
+@config.command("set-http2")
+@click.argument("state", type=click.Choice(["on", "off"]))
+def config_set_http2(state: str):
+    cfg = load_config()
+    cfg["http2"] = state == "on"
+    save_config(cfg)
+
+    click.echo(f"HTTP/2 {'enabled' if cfg['http2'] else 'disabled'}.")
+
 # ---------------------------------------------------------------------
 # Reset everything
 # ---------------------------------------------------------------------
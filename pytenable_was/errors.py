@@ -40,11 +40,31 @@ class TenableAPIError(Exception):
         super().__init__(message)
         self.status_code = status_code
         self.payload = payload
+        # Formatted once: the same error is often logged, echoed and
+        # re-raised through several CLI layers.
+        self._formatted = self._format()
 
-    def __str__(self):
+    def _format(self):
         base = super().__str__()
         if self.status_code:
             base = f"[HTTP {self.status_code}] {base}"
         if self.payload:
             base += f" | Payload: {self.payload}"
         return base
+
+    def __str__(self):
+        return self._formatted
+
+
+class ThrottleError(TenableAPIError):
+    """
+    Raised when Tenable keeps answering HTTP 429 after the retry budget
+    is exhausted.
+
+    Subclass of TenableAPIError, so existing handlers still catch it.
+    `retry_after` holds the last server-suggested delay in seconds, if any.
+    """
+
+    def __init__(self, message, status_code=429, payload=None, retry_after=None):
+        super().__init__(message, status_code=status_code, payload=payload)
+        self.retry_after = retry_after
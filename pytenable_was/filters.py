@@ -0,0 +1,74 @@
+# pytenable_was/filters.py
+
+"""
+WAS filter metadata (read-only)
+
+Endpoints:
+    GET /was/v2/filters/scan-configs
+    GET /was/v2/filters/scans
+    GET /was/v2/filters/user-templates
+    GET /was/v2/filters/vulnerabilities
+    GET /was/v2/filters/scans/vulnerabilities
+
+Each endpoint describes the fields, operators and values accepted by the
+matching search endpoint. Responses are returned as-is.
+"""
+
+import logging
+from typing import Any, Dict
+
+from .errors import TenableAPIError
+
+logger = logging.getLogger(__name__)
+
+
+class FiltersAPI:
+    """
+    Wrapper for WAS filter metadata endpoints.
+    """
+
+    def __init__(self, http):
+        self.http = http
+
+    # ---------------------------------------------------------
+    # Raw API calls
+    # ---------------------------------------------------------
+    def _api_get_filters(self, path: str) -> Dict[str, Any]:
+        logger.debug("Fetching filters %s", path)
+        raw = self.http.get(f"/was/v2/filters/{path}")
+        if not isinstance(raw, (dict, list)):
+            raise TenableAPIError(f"Malformed filter response for {path}")
+        return raw
+
+    # ---------------------------------------------------------
+    # Public Methods
+    # ---------------------------------------------------------
+    def scan_configs_filters(self) -> Dict[str, Any]:
+        """
+        Filters accepted when searching scan configurations.
+        """
+        return self._api_get_filters("scan-configs")
+
+    def scans_filters(self) -> Dict[str, Any]:
+        """
+        Filters accepted when searching scans.
+        """
+        return self._api_get_filters("scans")
+
+    def user_templates_filters(self) -> Dict[str, Any]:
+        """
+        Filters accepted when searching user-defined templates.
+        """
+        return self._api_get_filters("user-templates")
+
+    def vulns_filters(self) -> Dict[str, Any]:
+        """
+        Filters accepted when searching vulnerabilities.
+        """
+        return self._api_get_filters("vulnerabilities")
+
+    def vulns_scan_filters(self) -> Dict[str, Any]:
+        """
+        Filters accepted when searching the vulnerabilities of a scan.
+        """
+        return self._api_get_filters("scans/vulnerabilities")
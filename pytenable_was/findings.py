@@ -6,8 +6,12 @@ Tenable WAS v2 Findings Module (Rewritten)
 Supports:
     • Retrieve findings for a single scan
     • Export findings using /export/findings (full bulk export)
-    • Export flattened CSV/JSON
-    • Export ALL findings across ALL scans
+    • Export flattened CSV/JSON, or JSON Lines
+    • Export ALL findings across ALL scans (scans exported concurrently)
+    • Concurrent multi-scan retrieval (bounded thread pool)
+    • Severity / plugin filtering over a cached per-scan index
+    • Per-scan severity summary
+    • In-memory cache, plus optional on-disk cache for completed scans
     • Progress bars (tqdm)
     • Unified flattening, writing, and error handling via utils
 
@@ -16,15 +20,27 @@ This module replaces the older findings_export.py by integrating its
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from collections import Counter
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 
 from tqdm import tqdm
 
+from .cache import InMemoryCache
 from .errors import TenableAPIError
 from .utils import (
-    flatten_dict,
-    write_csv_safe,
+    SEVERITY_ORDER,
+    bounded_imap,
+    bounded_map,
+    flatten_dicts,
+    flatten_keys,
+    write_csv_rows,
+    tee_json,
+    tee_jsonl,
+    write_csv_spooled,
     write_json_safe,
+    write_jsonl_stream,
+    write_raw_safe,
     timestamp_filename,
 )
 
@@ -45,13 +61,43 @@ class FindingsAPI:
 
     Public operations:
         • list_findings()
+        • list_findings_bulk()
+        • export_findings_bulk()
+        • get_finding()
+        • filter()
+        • filter_by_url()
+        • sort_by_severity()
+        • summary()
         • export_findings_json()
+        • export_findings_raw()
         • export_findings_csv()
         • export_all_findings()
         • export_all_findings_flat()
+        • export_all_findings_files()
     """
 
-    def __init__(self, http, scans_api):
+    # Findings of scans in these states no longer change and may be persisted
+    FINAL_SCAN_STATUSES = frozenset({"completed"})
+
+    # Findings per scan are kept in memory for CACHE_TTL seconds; at most
+    # CACHE_SIZE scans are held (least recently used evicted first).
+    CACHE_TTL = 600
+    CACHE_SIZE = 32
+
+    # Scans kept per namespace in the disk cache; the oldest-written
+    # entries are evicted beyond this.
+    DISK_CACHE_MAX_SCANS = 500
+
+    # Keys that identify a finding, in order of preference
+    FINDING_ID_KEYS = ("finding_id", "vuln_id", "id")
+
+    def __init__(
+        self,
+        http,
+        scans_api,
+        cache: Optional[InMemoryCache] = None,
+        disk_cache=None,
+    ):
         """
         Parameters
         ----------
@@ -59,9 +105,22 @@ class FindingsAPI:
             Configured HTTP client w/ auth + retry logic.
         scans_api : ScansAPI
             Required so we can iterate all scans during export-all.
+        cache : InMemoryCache, optional
+            Per-process cache (created with maxsize=CACHE_SIZE if omitted).
+        disk_cache : DiskCache, optional
+            Persistent cache. Findings are only written to it for scans
+            whose status is in FINAL_SCAN_STATUSES.
         """
         self.http = http
         self.scans = scans_api
+        self.cache = cache or InMemoryCache(maxsize=self.CACHE_SIZE)
+        self.disk_cache = disk_cache
+
+        # scan_id -> status, learned from scan listings during export-all
+        self._known_status: Dict[str, Any] = {}
+
+        # scan_id -> normalized lookup columns (see _build_index)
+        self._filter_index: Dict[str, Dict[str, List[Any]]] = {}
 
     # --------------------------------------------------------------------------
     # RAW API CALLS
@@ -103,31 +162,322 @@ class FindingsAPI:
     # RETRIEVE + NORMALIZE
     # --------------------------------------------------------------------------
 
-    def list_findings(self, scan_id: str) -> List[Dict[str, Any]]:
+    def _is_scan_final(self, scan_id: str) -> bool:
+        status = self._known_status.get(scan_id)
+        if status is None and self.scans is not None:
+            try:
+                status = self.scans.get_scan(scan_id).get("status")
+            except TenableAPIError as exc:
+                logger.debug("Could not read status of scan %s: %s", scan_id, exc)
+                return False
+        return str(status or "").lower() in self.FINAL_SCAN_STATUSES
+
+    def _cached(
+        self,
+        namespace: str,
+        scan_id: str,
+        fetch,
+        use_cache: bool,
+        remember: bool = True,
+    ) -> List[Dict[str, Any]]:
         """
-        Retrieve findings using GET /findings.
-        May be partial for very large scans. Prefer export_findings_* for full data.
+        Resolve findings memory -> disk -> network.
+
+        Network results go to the memory cache, and to the disk cache
+        when the scan is finished. With remember=False the memory cache
+        is only read, never filled (export-all touches every scan once;
+        keeping them would hold the whole tenant in memory).
         """
+        if use_cache:
+            try:
+                return self.cache.get(namespace, scan_id)
+            except KeyError:
+                pass
+
+            if self.disk_cache is not None:
+                try:
+                    findings = self.disk_cache.get(namespace, scan_id)
+                    logger.debug("Loaded %s for scan %s from disk cache.", namespace, scan_id)
+                    if remember:
+                        self.cache.set(namespace, scan_id, findings, ttl=self.CACHE_TTL)
+                    return findings
+                except KeyError:
+                    pass
+
+        findings = fetch(scan_id)
+        if remember:
+            self.cache.set(namespace, scan_id, findings, ttl=self.CACHE_TTL)
+
+        if self.disk_cache is not None and self._is_scan_final(scan_id):
+            self.disk_cache.set(namespace, scan_id, findings)
+            self.disk_cache.prune(namespace, self.DISK_CACHE_MAX_SCANS)
+
+        return findings
+
+    def _fetch_findings(self, scan_id: str) -> List[Dict[str, Any]]:
         payload = self._api_get_findings(scan_id)
         findings = payload.get("findings", [])
         if not isinstance(findings, list):
             raise TenableAPIError("Malformed findings payload")
         return findings
 
-    def export_findings_full(self, scan_id: str) -> List[Dict[str, Any]]:
-        """
-        Retrieve *full* findings for a scan using /export/findings.
-
-        This is the preferred method when exporting a single scan’s entire dataset.
-        """
+    def _fetch_export(self, scan_id: str) -> List[Dict[str, Any]]:
         payload = self._api_export_findings(scan_id)
         findings = payload.get("findings", [])
         if not isinstance(findings, list):
             raise TenableAPIError("Malformed export-findings payload")
         return findings
 
+    def list_findings(self, scan_id: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Retrieve findings using GET /findings.
+        May be partial for very large scans. Prefer export_findings_* for full data.
+        """
+        return self._cached("findings", scan_id, self._fetch_findings, use_cache)
+
+    def export_findings_full(self, scan_id: str, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Retrieve *full* findings for a scan using /export/findings.
+
+        This is the preferred method when exporting a single scan’s entire dataset.
+        """
+        return self._cached("findings_export", scan_id, self._fetch_export, use_cache)
+
+    # --------------------------------------------------------------------------
+    # FILTERING
+    # --------------------------------------------------------------------------
+
+    def _build_index(self, scan_id: str, refresh: bool = False) -> Dict[str, List[Any]]:
+        """
+        Fetch a scan's findings once and keep parallel, pre-normalized
+        columns for filtering:
+
+            {
+                "findings":   [...],   # raw finding dicts
+                "severities": [...],   # lowercased severity per finding
+                "statuses":   [...],   # lowercased status per finding
+                "plugins":    [...],   # str(plugin_id) per finding
+                "urls":       [...],   # lowercased url per finding
+            }
+
+        The index lives for the lifetime of this FindingsAPI instance;
+        pass refresh=True to re-fetch.
+        """
+        index = self._filter_index.get(scan_id)
+        if index is None or refresh:
+            findings = self.list_findings(scan_id, use_cache=not refresh)
+            index = {
+                "findings": findings,
+                "severities": [str(f.get("severity") or "").lower() for f in findings],
+                "statuses": [str(f.get("status") or "").lower() for f in findings],
+                "plugins": [str(f.get("plugin_id") or "") for f in findings],
+                "urls": [str(f.get("url") or "").lower() for f in findings],
+            }
+            self._filter_index[scan_id] = index
+        return index
+
+    def get_finding(self, scan_id: str, finding_id: Any) -> Dict[str, Any]:
+        """
+        Return a single finding of a scan by ID.
+
+        Lookups use an ID map built once per indexed scan, so fetching
+        many findings of the same scan is O(1) each. A miss re-fetches
+        the scan once before giving up.
+        """
+        want = str(finding_id)
+
+        for refresh in (False, True):
+            index = self._build_index(scan_id, refresh=refresh)
+            by_id = index.get("by_id")
+            if by_id is None:
+                by_id = index["by_id"] = {}
+                for f in index["findings"]:
+                    fid = next((f[k] for k in self.FINDING_ID_KEYS if f.get(k) is not None), None)
+                    if fid is not None:
+                        by_id.setdefault(str(fid), f)
+            try:
+                return by_id[want]
+            except KeyError:
+                continue
+
+        raise TenableAPIError(f"Finding {finding_id} not found in scan {scan_id}")
+
+    def filter(
+        self,
+        scan_id: str,
+        severity: Optional[str] = None,
+        plugin_id: Optional[Any] = None,
+        status: Optional[str] = None,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return findings for a scan matching severity, plugin_id and/or status.
+
+        Matching is case-insensitive for severity and status; plugin_id is
+        compared as a string. With no criteria, all findings are returned.
+        """
+        index = self._build_index(scan_id, refresh=refresh)
+        findings = index["findings"]
+
+        criteria = [
+            (index[column], want)
+            for column, want in (
+                ("severities", severity.lower() if severity else None),
+                ("statuses", status.lower() if status else None),
+                ("plugins", str(plugin_id) if plugin_id is not None else None),
+            )
+            if want is not None
+        ]
+
+        if not criteria:
+            return list(findings)
+
+        if len(criteria) == 1:
+            column, want = criteria[0]
+            return [f for f, v in zip(findings, column) if v == want]
+
+        return [
+            f
+            for i, f in enumerate(findings)
+            if all(column[i] == want for column, want in criteria)
+        ]
+
+    def group_by_severity(self, scan_id: str, refresh: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Bucket a scan's findings by lowercased severity, reusing the
+        index's pre-normalized column. Same keys as
+        utils.group_by_severity(): every severity level, empty or not,
+        plus "unknown" for missing or unrecognized severities.
+        """
+        index = self._build_index(scan_id, refresh=refresh)
+        groups: Dict[str, List[Dict[str, Any]]] = {k: [] for k in SEVERITY_ORDER}
+        unknown = groups["unknown"] = []
+        bucket_for = groups.get
+        for f, sev in zip(index["findings"], index["severities"]):
+            bucket = bucket_for(sev) if sev else None
+            (unknown if bucket is None else bucket).append(f)
+        return groups
+
+    def filter_by_url(
+        self,
+        scan_id: str,
+        substrings: Union[str, List[str]],
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return findings whose URL contains the substring (case-insensitive).
+
+        A list of substrings matches findings containing ANY of them; the
+        alternatives are compiled into one regex so each URL is scanned
+        once regardless of how many patterns are given.
+        """
+        index = self._build_index(scan_id, refresh=refresh)
+        findings, urls = index["findings"], index["urls"]
+
+        if isinstance(substrings, str):
+            substrings = [substrings]
+        wanted = [s.lower() for s in substrings if s]
+        if not wanted:
+            return []
+
+        if len(wanted) == 1:
+            sub = wanted[0]
+            return [f for f, u in zip(findings, urls) if sub in u]
+
+        search = re.compile("|".join(map(re.escape, wanted))).search
+        return [f for f, u in zip(findings, urls) if search(u)]
+
+    def sort_by_severity(
+        self,
+        scan_id: str,
+        reverse: bool = True,
+        refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return a scan's findings ordered by severity (critical first by
+        default), ranking from the index's pre-lowercased severities.
+        Unknown severities sort last; ties keep API order.
+        """
+        index = self._build_index(scan_id, refresh=refresh)
+        findings = index["findings"]
+        rank = SEVERITY_ORDER.get
+        ranks = [rank(s, -1) for s in index["severities"]]
+        order = sorted(range(len(findings)), key=ranks.__getitem__, reverse=reverse)
+        return [findings[i] for i in order]
+
+    def summary(self, scan_id: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Severity counts for a scan's findings, in one pass.
+
+        Example:
+            {
+              "scan_id": "...",
+              "total": 12,
+              "critical": 1,
+              "high": 3,
+              "medium": 4,
+              "low": 2,
+              "info": 2
+            }
+        """
+        index = self._build_index(scan_id, refresh=refresh)
+        counts = Counter(index["severities"])
+
+        return {
+            "scan_id": scan_id,
+            "total": len(index["severities"]),
+            "critical": counts["critical"],
+            "high": counts["high"],
+            "medium": counts["medium"],
+            "low": counts["low"],
+            "info": counts["info"],
+        }
+
+    # --------------------------------------------------------------------------
+    # MULTI-SCAN RETRIEVAL (CONCURRENT)
+    # --------------------------------------------------------------------------
+
+    def _fetch_bulk(self, fetch, scan_ids: List[str], max_workers: int) -> Dict[str, List[Dict[str, Any]]]:
+        def _one(scan_id):
+            try:
+                return scan_id, fetch(scan_id)
+            except TenableAPIError as exc:
+                logger.error("Failed retrieving findings for scan %s: %s", scan_id, exc)
+                return scan_id, None
+
+        results = bounded_map(_one, scan_ids, max_workers=max_workers)
+        return {sid: findings for sid, findings in results if findings is not None}
+
+    def list_findings_bulk(
+        self,
+        scan_ids: List[str],
+        max_workers: int = 16,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        list_findings() for many scans, issued concurrently.
+
+        Returns:
+            { scan_id: [finding, ...], ... }
+        Scans that fail are logged and omitted.
+        """
+        return self._fetch_bulk(self.list_findings, scan_ids, max_workers)
+
+    def export_findings_bulk(
+        self,
+        scan_ids: List[str],
+        max_workers: int = 16,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        export_findings_full() for many scans, issued concurrently.
+
+        Returns:
+            { scan_id: [finding, ...], ... }
+        Scans that fail are logged and omitted.
+        """
+        return self._fetch_bulk(self.export_findings_full, scan_ids, max_workers)
+
     # --------------------------------------------------------------------------
-    # EXPORT SINGLE SCAN (JSON/CSV)
+    # EXPORT SINGLE SCAN (JSON/JSONL/CSV)
     # --------------------------------------------------------------------------
 
     def export_findings_json(self, scan_id: str, path: Optional[str] = None) -> str:
@@ -145,10 +495,48 @@ class FindingsAPI:
         write_json_safe(path, payload)
         return path
 
+    def export_findings_jsonl(self, scan_id: str, path: Optional[str] = None) -> str:
+        """
+        Export full findings to JSON Lines (one finding per line).
+
+        If path is None, generates:
+            findings_<scanid>_<timestamp>.jsonl
+        """
+        if path is None:
+            path = timestamp_filename(prefix=f"findings_{scan_id}", ext="jsonl")
+
+        write_jsonl_stream(path, [self.export_findings_full(scan_id)])
+        return path
+
+    def export_findings_raw(self, scan_id: str, path: Optional[str] = None) -> str:
+        """
+        Save the /export/findings response exactly as Tenable returns it.
+
+        The body is streamed to disk in chunks and never parsed, so large
+        scans export with flat memory use. Unlike export_findings_json, the
+        caches are bypassed and the file keeps the API's own layout.
+
+        If path is None, generates:
+            findings_<scanid>_raw_<timestamp>.json
+        """
+        if path is None:
+            path = timestamp_filename(prefix=f"findings_{scan_id}_raw", ext="json")
+
+        body = {"scan_id": scan_id}
+
+        def _fill(fh):
+            self.http.stream("POST", "/was/v2/export/findings", fh, json=body)
+
+        return write_raw_safe(path, _fill)
+
     def export_findings_csv(self, scan_id: str, path: Optional[str] = None) -> str:
         """
         Export full findings to CSV (flattened rows).
 
+        Rows are flattened one at a time as they are written; the header
+        comes from a key-only pass, so no full list of flattened rows is
+        ever held in memory.
+
         If path is None, generates:
             findings_<scanid>_<timestamp>.csv
         """
@@ -156,47 +544,91 @@ class FindingsAPI:
             path = timestamp_filename(prefix=f"findings_{scan_id}", ext="csv")
 
         findings = self.export_findings_full(scan_id)
-        rows = [flatten_dict(f) for f in findings]
-        write_csv_safe(path, rows)
+        fieldnames = dict.fromkeys(k for f in findings for k in flatten_keys(f))
+        write_csv_rows(path, list(fieldnames), flatten_dicts(findings))
         return path
 
     # --------------------------------------------------------------------------
     # EXPORT-ALL FINDINGS ACROSS ALL SCANS
     # --------------------------------------------------------------------------
 
-    def export_all_findings(self) -> List[Dict[str, Any]]:
+    def _iter_all_scan_findings(self, desc: str, max_workers: int) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
         """
-        Return **raw, unflattened** findings for EVERY scan in the tenant.
-
-        Returns:
-            [
-                {"scan_id": "...", "findings": [...]},
-                ...
-            ]
+        Yield (scan_id, findings) for every scan in the tenant, in scan
+        list order, with up to `max_workers` scan exports in flight.
+        Scans that fail are logged and skipped.
         """
-        scans = self.scans.list_scans()
-        results = []
-
-        for sc in tqdm(scans, desc="Exporting findings (raw)", unit="scan"):
+        scan_ids = []
+        for sc in self.scans.list_scans():
             scan_id = sc.get("scan_id") or sc.get("id")
             if not scan_id:
                 continue
+            self._known_status[scan_id] = sc.get("status")
+            scan_ids.append(scan_id)
 
+        def _one(scan_id):
             try:
-                findings = self.export_findings_full(scan_id)
-                results.append({
-                    "scan_id": scan_id,
-                    "findings": findings
-                })
+                # disk cache only: see _cached(remember=False)
+                return scan_id, self._cached(
+                    "findings_export", scan_id, self._fetch_export, use_cache=True, remember=False
+                )
             except TenableAPIError as exc:
                 logger.error("Failed exporting scan %s: %s", scan_id, exc)
+                return scan_id, None
+
+        results = bounded_imap(_one, scan_ids, max_workers=max_workers)
+        pbar = tqdm(
+            results,
+            total=len(scan_ids),
+            desc=desc,
+            unit="scan",
+            mininterval=0.5,
+            miniters=max(1, len(scan_ids) // 200),
+            smoothing=0.1,
+        )
+        for scan_id, findings in pbar:
+            if findings is not None:
+                yield scan_id, findings
+
+    @staticmethod
+    def _tag_findings(scans: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for scan in scans:
+            for finding in scan["findings"]:
+                yield {**finding, "scan_id": scan["scan_id"]}
+
+    @staticmethod
+    def _flatten_scan(scan_id: str, findings: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for flat in flatten_dicts(findings):
+            flat["scan_id"] = scan_id
+            yield flat
+
+    def _iter_all_findings_flat(self, desc: str, max_workers: int) -> Iterator[Dict[str, Any]]:
+        for scan_id, findings in self._iter_all_scan_findings(desc, max_workers):
+            yield from self._flatten_scan(scan_id, findings)
+
+    def export_all_findings(self, max_workers: int = 8) -> List[Dict[str, Any]]:
+        """
+        Return **raw, unflattened** findings for EVERY scan in the tenant.
+
+        Up to `max_workers` scans are exported concurrently.
 
-        return results
+        Returns:
+            [
+                {"scan_id": "...", "findings": [...]},
+                ...
+            ]
+        """
+        return [
+            {"scan_id": scan_id, "findings": findings}
+            for scan_id, findings in self._iter_all_scan_findings("Exporting findings (raw)", max_workers)
+        ]
 
-    def export_all_findings_flat(self) -> List[Dict[str, Any]]:
+    def export_all_findings_flat(self, max_workers: int = 8) -> List[Dict[str, Any]]:
         """
         Return a single flattened list of ALL findings across ALL scans.
 
+        Up to `max_workers` scans are exported concurrently.
+
         Output:
             [
                 {
@@ -206,48 +638,86 @@ class FindingsAPI:
                 ...
             ]
         """
-        scans = self.scans.list_scans()
-        all_rows = []
-
-        for sc in tqdm(scans, desc="Exporting findings (flattened)", unit="scan"):
-            scan_id = sc.get("scan_id") or sc.get("id")
-            if not scan_id:
-                continue
-
-            try:
-                findings = self.export_findings_full(scan_id)
-            except TenableAPIError:
-                continue
-
-            for f in findings:
-                flat = flatten_dict(f)
-                flat["scan_id"] = scan_id
-                all_rows.append(flat)
-
-        return all_rows
+        return list(self._iter_all_findings_flat("Exporting findings (flattened)", max_workers))
 
     # --------------------------------------------------------------------------
-    # EXPORT-ALL FILE WRITERS (JSON/CSV)
+    # EXPORT-ALL FILE WRITERS (JSON/JSONL/CSV)
     # --------------------------------------------------------------------------
 
-    def export_all_findings_json(self, path: Optional[str] = None) -> str:
+    def export_all_findings_files(
+        self,
+        json_path: Optional[str] = None,
+        jsonl_path: Optional[str] = None,
+        csv_path: Optional[str] = None,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Export findings for all scans to every given file, fetching each
+        scan once.
+
+        json_path gets the export_all_findings() layout, jsonl_path one
+        finding (with "scan_id") per line, and csv_path the
+        export_all_findings_flat() rows (spooled, so memory use does not
+        grow with the number of findings). Each scan is written to all
+        files as soon as it has been exported.
+        """
+        pages = (
+            [{"scan_id": scan_id, "findings": findings}]
+            for scan_id, findings in self._iter_all_scan_findings("Exporting findings", max_workers)
+        )
+        if json_path:
+            pages = tee_json(json_path, pages)
+        if jsonl_path:
+            pages = tee_jsonl(jsonl_path, pages, records=self._tag_findings)
+
+        if csv_path:
+            rows = (
+                row
+                for page in pages
+                for scan in page
+                for row in self._flatten_scan(scan["scan_id"], scan["findings"])
+            )
+            write_csv_spooled(csv_path, rows, trailing=("scan_id",))
+        else:
+            for _ in pages:
+                pass
+
+    def export_all_findings_json(self, path: Optional[str] = None, max_workers: int = 8) -> str:
         """
         Write all raw findings for all scans to a JSON file.
+
+        Same layout as export_all_findings(), but each scan is written as
+        soon as it has been exported, so only the scans in flight are held
+        in memory.
         """
         if path is None:
             path = timestamp_filename(prefix="findings_all", ext="json")
 
-        data = self.export_all_findings()
-        write_json_safe(path, data)
+        self.export_all_findings_files(json_path=path, max_workers=max_workers)
+        return path
+
+    def export_all_findings_jsonl(self, path: Optional[str] = None, max_workers: int = 8) -> str:
+        """
+        Write all raw findings for all scans to a JSON Lines file: one
+        finding per line, with its "scan_id" added. Each scan is written
+        as soon as it has been exported.
+        """
+        if path is None:
+            path = timestamp_filename(prefix="findings_all", ext="jsonl")
+
+        self.export_all_findings_files(jsonl_path=path, max_workers=max_workers)
         return path
 
-    def export_all_findings_csv(self, path: Optional[str] = None) -> str:
+    def export_all_findings_csv(self, path: Optional[str] = None, max_workers: int = 8) -> str:
         """
         Write all flattened findings for all scans to a CSV file.
+
+        Same columns as export_all_findings_flat(). Rows are spooled to a
+        temporary file while the header is collected, so memory use does
+        not grow with the number of findings.
         """
         if path is None:
             path = timestamp_filename(prefix="findings_all", ext="csv")
 
-        rows = self.export_all_findings_flat()
-        write_csv_safe(path, rows)
+        self.export_all_findings_files(csv_path=path, max_workers=max_workers)
         return path
@@ -3,43 +3,382 @@ HTTP Client for Tenable WAS v2
 
 Handles:
     - X-API-Key authentication
-    - GET, POST, PUT, DELETE
+    - GET, POST, PUT, PATCH, DELETE
+    - Persistent keep-alive connections (pooled requests.Session)
+    - Optional HTTP/2 multiplexing via httpx (`http2=True`)
     - Proxy support
-    - 429 retry with exponential backoff
-    - JSON decoding
+    - 429 retry honoring Retry-After / X-RateLimit-Reset, falling back
+      to capped exponential backoff with full jitter
+    - adaptive client-side admission throttle (token bucket that slows
+      down on 429 and recovers on sustained success)
+    - in-pool retries of idempotent calls on 502/503/504 and dropped
+      connections (urllib3 Retry on the session adapter)
+    - ETag / If-None-Match conditional GETs (bounded LRU)
+    - opt-in short-TTL memoization of identical GETs (cleared on writes)
+    - compressed responses (gzip/deflate, plus br/zstd when the decoders
+      are installed)
+    - JSON decoding (orjson when installed), or raw body streaming to a
+      file-like sink for large exports
     - TenableAPIError wrapping
 """
 
+import logging
+import random
+import threading
 import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple, Union
+from urllib.parse import urlencode
+
 import requests
-from typing import Any, Dict, Optional
-from .errors import TenableAPIError
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .errors import TenableAPIError, ThrottleError
+from .utils import json_loads
+
+logger = logging.getLogger(__name__)
+
+
+def _server_retry_delay(headers) -> Optional[float]:
+    """
+    Seconds to wait according to the server, or None if it did not say.
+
+    Understands:
+        Retry-After: <seconds> | <HTTP-date>
+        X-RateLimit-Reset: <seconds> | <epoch seconds>
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError, IndexError, OverflowError):
+            pass
+
+    reset = headers.get("X-RateLimit-Reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        now = time.time()
+        # large values are an absolute epoch, small ones a relative delay
+        return max(0.0, value - now) if value > now - 86400 else max(0.0, value)
+
+    return None
+
+
+class _AdmissionThrottle:
+    """
+    Token bucket whose refill rate adapts to server pushback.
+
+    Every outgoing request takes one token. A 429 halves the rate (down
+    to `min_rate`); `recover_after` consecutive successes double it again
+    (up to the configured rate). Concurrent workers sharing one
+    HTTPClient therefore back off together instead of each discovering
+    the quota with its own rejected requests.
+    """
+
+    def __init__(self, rate: float, burst: float, min_rate: float, recover_after: int):
+        self.max_rate = self.rate = float(rate)
+        self.burst = float(burst)
+        self.min_rate = float(min_rate)
+        self.recover_after = recover_after
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def penalize(self) -> None:
+        with self._lock:
+            self._successes = 0
+            rate = max(self.min_rate, self.rate / 2)
+            if rate != self.rate:
+                logger.debug("Throttled by server; admission rate %.2f -> %.2f req/s", self.rate, rate)
+                self.rate = rate
+            # at most one second's worth of burst at the new rate
+            self._tokens = min(self._tokens, self.rate)
+
+    def recover(self) -> None:
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            self._successes += 1
+            if self._successes >= self.recover_after:
+                self._successes = 0
+                rate = min(self.max_rate, self.rate * 2)
+                logger.debug("Admission rate recovering %.2f -> %.2f req/s", self.rate, rate)
+                self.rate = rate
+
+
+class _HTTPXSession:
+    """
+    Minimal requests.Session look-alike backed by an HTTP/2 httpx.Client.
+
+    Only the surface HTTPClient uses is implemented (request + close, and
+    stream=True responses iterated with iter_content), so
+    the retry, caching and error handling in _request are shared by both
+    transports. Transport failures are re-raised as
+    requests.RequestException for the same reason.
+    """
+
+    def __init__(self, proxies: Optional[Dict[str, str]], max_keepalive: int, max_connections: int):
+        import httpx
+
+        self._httpx = httpx
+        proxy = None
+        if proxies:
+            proxy = proxies.get("https") or proxies.get("http")
+
+        self._client = httpx.Client(
+            http2=True,
+            proxy=proxy,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive,
+                max_connections=max_connections,
+            ),
+        )
+
+    def request(self, method, url, headers=None, params=None, json=None, proxies=None, timeout=None,
+                stream=False):
+        # proxies are fixed on the client at construction time
+        if isinstance(timeout, tuple):
+            # requests' (connect, read) pair; httpx wants a Timeout object
+            timeout = self._httpx.Timeout(timeout[1], connect=timeout[0])
+        try:
+            if stream:
+                req = self._client.build_request(
+                    method, url, headers=headers, params=params, json=json, timeout=timeout
+                )
+                response = self._client.send(req, stream=True)
+                if response.status_code >= 400:
+                    response.read()  # small error body; lets .json()/.text work
+                # requests' spelling, so HTTPClient.stream() serves both transports
+                response.iter_content = response.iter_bytes
+                return response
+            return self._client.request(
+                method, url, headers=headers, params=params, json=json, timeout=timeout
+            )
+        except self._httpx.HTTPError as exc:
+            raise requests.RequestException(str(exc)) from exc
+
+    def close(self) -> None:
+        self._client.close()
 
 
 class HTTPClient:
     BASE_URL = "https://cloud.tenable.com"
 
-    def __init__(self, api_key: str, proxy: Optional[str] = None, timeout: int = 30):
+    # Connection pool sizing for the shared session
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 32
+
+    # Transient upstream failures retried by the session adapter itself.
+    # 429 stays in _request so it can raise ThrottleError when exhausted;
+    # the adapter ignores Retry-After, since urllib3 would otherwise retry
+    # any 429 carrying that header on its own, inside _request's loop.
+    RETRY_TOTAL = 5
+    RETRY_BACKOFF = 1.0
+    RETRY_STATUSES = (502, 503, 504)
+    RETRY_METHODS = frozenset(["GET", "PUT", "DELETE"])
+
+    # 429 handling: attempts, full-jitter backoff (uniform(0, min(cap,
+    # base * 2**n))) and a ceiling on the total time spent waiting.
+    THROTTLE_RETRIES = 5
+    THROTTLE_BACKOFF_BASE = 1.0
+    THROTTLE_BACKOFF_CAP = 30.0
+    THROTTLE_MAX_WAIT = 120.0
+
+    # Client-side admission control (requests/second ceiling and burst);
+    # see _AdmissionThrottle. ADMISSION_RATE = 0 disables it.
+    ADMISSION_RATE = 20.0
+    ADMISSION_BURST = 20
+    ADMISSION_MIN_RATE = 0.5
+    ADMISSION_RECOVER_AFTER = 20
+
+    # Max number of GET responses remembered for If-None-Match revalidation
+    ETAG_CACHE_SIZE = 256
+
+    # Identical GETs within this many seconds are answered from memory.
+    # Off by default: the memo only sees this client's own writes, so a
+    # scan finishing server-side would otherwise read as stale for up to
+    # the TTL. Any POST/PUT/PATCH/DELETE clears the memo.
+    GET_CACHE_TTL = 0
+    GET_CACHE_SIZE = 512
+
+    # Chunk size for stream() copies
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        api_key: str,
+        proxy: Optional[str] = None,
+        timeout: Union[float, Tuple[float, float]] = 30,
+        proxies: Optional[Dict[str, str]] = None,
+        http2: bool = False,
+    ):
         self.api_key = api_key
+        # seconds, or a (connect, read) tuple as accepted by requests
         self.timeout = timeout
 
-        self.proxies = None
-        if proxy:
+        self.proxies = proxies
+        if proxy and not proxies:
             self.proxies = {
                 "http": proxy,
                 "https": proxy
             }
 
-    # ------------------------------------------------------------
-    # Build headers
-    # ------------------------------------------------------------
-    def _headers(self) -> Dict[str, str]:
-        return {
+        # Auth headers never change for the life of the client
+        self._base_headers = {
             "Accept": "application/json",
+            # every codec urllib3 can decode here ("gzip,deflate" plus
+            # br/zstd when brotli/zstandard are installed)
+            "Accept-Encoding": ACCEPT_ENCODING,
             "Content-Type": "application/json",
             "X-API-Key": self.api_key,
         }
 
+        # One session for every call: TCP/TLS handshakes are paid once per
+        # pooled connection instead of once per request. Gateway errors and
+        # dropped connections on idempotent calls are retried by the adapter
+        # on the same pool; throttling (429) is handled in _request.
+        #
+        # With http2=True (requires `pip install pytenable-was[http2]`),
+        # concurrent calls are multiplexed as streams over a single TLS
+        # connection instead.
+        self.http2 = False
+        if http2:
+            try:
+                self.session = _HTTPXSession(
+                    self.proxies, self.POOL_CONNECTIONS, self.POOL_MAXSIZE
+                )
+                self.http2 = True
+            except ImportError:
+                logger.warning("HTTP/2 requested but httpx[http2] is not installed; using HTTP/1.1.")
+
+        if not self.http2:
+            self.session = requests.Session()
+            retry = Retry(
+                total=self.RETRY_TOTAL,
+                backoff_factor=self.RETRY_BACKOFF,
+                status_forcelist=self.RETRY_STATUSES,
+                allowed_methods=self.RETRY_METHODS,
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE,
+                max_retries=retry,
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        # GET key -> (etag, raw body) and GET key -> (fetched_at, raw body).
+        # Raw bytes are kept rather than decoded objects so every caller
+        # gets its own, safely mutable copy.
+        self._etag_cache: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._get_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        self._throttle: Optional[_AdmissionThrottle] = None
+        if self.ADMISSION_RATE > 0:
+            self._throttle = _AdmissionThrottle(
+                self.ADMISSION_RATE,
+                self.ADMISSION_BURST,
+                self.ADMISSION_MIN_RATE,
+                self.ADMISSION_RECOVER_AFTER,
+            )
+
+    # ------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # ------------------------------------------------------------
+    # Build headers
+    # ------------------------------------------------------------
+    def _headers(self) -> Dict[str, str]:
+        return self._base_headers
+
+    # ------------------------------------------------------------
+    # Response caches (ETag + short-TTL memo)
+    # ------------------------------------------------------------
+    @staticmethod
+    def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return path
+        return f"{path}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def _lru_get(self, cache: OrderedDict, key: str):
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+            return entry
+
+    def _lru_put(self, cache: OrderedDict, key: str, entry: tuple, size: int) -> None:
+        with self._cache_lock:
+            cache[key] = entry
+            cache.move_to_end(key)
+            while len(cache) > size:
+                cache.popitem(last=False)
+
+    def _memo_lookup(self, key: str) -> Optional[bytes]:
+        if self.GET_CACHE_TTL <= 0:
+            return None
+        entry = self._lru_get(self._get_cache, key)
+        if entry is None or time.monotonic() - entry[0] >= self.GET_CACHE_TTL:
+            return None
+        return entry[1]
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop memoized GET responses.
+
+        With no path, everything is dropped; otherwise the path itself,
+        its query-string variants, and anything beneath it.
+        """
+        with self._cache_lock:
+            if path is None:
+                self._get_cache.clear()
+                return
+            for key in [
+                k for k in self._get_cache
+                if k == path or k.startswith((f"{path}?", f"{path}/"))
+            ]:
+                del self._get_cache[key]
+
+    def clear_etag_cache(self) -> None:
+        with self._cache_lock:
+            self._etag_cache.clear()
+
     # ------------------------------------------------------------
     # Internal request wrapper
     # ------------------------------------------------------------
@@ -52,55 +391,185 @@ class HTTPClient:
     ):
         url = f"{self.BASE_URL}{path}"
 
-        retries = 5
-        backoff = 2
+        headers = self._base_headers
+        cache_key = cached = None
+        if method == "GET":
+            cache_key = self._cache_key(path, params)
+            memo = self._memo_lookup(cache_key)
+            if memo is not None:
+                return json_loads(memo)
+            cached = self._lru_get(self._etag_cache, cache_key)
+            if cached is not None:
+                headers = {**self._base_headers, "If-None-Match": cached[0]}
+        else:
+            # a write may change anything we have memoized
+            self.invalidate()
+
+        response = self._send(method, url, headers, params, json_body)
+
+        # Success is the common case: 2xx costs two comparisons in total
+        status = response.status_code
+        if status >= 300:
+            # Error handling
+            if status >= 400:
+                raise self._error(response)
+
+            # Not modified: serve the body we already have
+            if status == 304 and cached is not None:
+                self._remember(cache_key, cached[1])
+                return json_loads(cached[1])
+
+        # No content (explicit 204, or an empty/whitespace body)
+        elif status == 204:
+            return None
+
+        body = response.content
+        if not body or body.isspace():
+            return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s %s: HTTP %s in %.0f ms, %s bytes on the wire (%s), %s decoded",
+                method, path, status, response.elapsed.total_seconds() * 1000,
+                response.headers.get("Content-Length", "?"),
+                response.headers.get("Content-Encoding", "identity"), len(body),
+            )
+
+        # JSON response: parsed straight from bytes, no intermediate str
+        try:
+            data = json_loads(body)
+        except ValueError:
+            raise TenableAPIError("Invalid JSON response from Tenable API.")
+
+        if cache_key is not None:
+            self._remember(cache_key, body)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._lru_put(self._etag_cache, cache_key, (etag, body), self.ETAG_CACHE_SIZE)
+
+        return data
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        json_body: Optional[Dict[str, Any]],
+        stream: bool = False,
+    ):
+        """
+        Issue one logical request: admission throttle, transport errors,
+        and the 429 retry loop. Returns the final (non-429) response.
+        """
+        extra = {"stream": True} if stream else {}
+
+        attempt = 0
+        waited = 0.0
+
+        throttle = self._throttle
 
         while True:
+            if throttle is not None:
+                throttle.acquire()
+
             try:
-                response = requests.request(
+                response = self.session.request(
                     method=method,
                     url=url,
-                    headers=self._headers(),
+                    headers=headers,
                     params=params,
                     json=json_body,
                     proxies=self.proxies,
                     timeout=self.timeout,
+                    **extra,
                 )
             except requests.RequestException as exc:
                 raise TenableAPIError(f"HTTP request failed: {exc}")
 
             # Handle rate-limiting
             if response.status_code == 429:
-                if retries <= 0:
-                    raise TenableAPIError("Too many retries (429 Too Many Requests)")
-                time.sleep(backoff)
-                retries -= 1
-                backoff *= 2
+                if throttle is not None:
+                    throttle.penalize()
+                server_delay = _server_retry_delay(response.headers)
+                if server_delay is not None:
+                    # small jitter so parallel workers do not retry in lockstep
+                    delay = server_delay + random.uniform(0, 0.5)
+                else:
+                    # full jitter: decorrelates clients sharing one quota
+                    delay = random.uniform(
+                        0, min(self.THROTTLE_BACKOFF_CAP, self.THROTTLE_BACKOFF_BASE * 2 ** attempt)
+                    )
+                if attempt >= self.THROTTLE_RETRIES or waited + delay > self.THROTTLE_MAX_WAIT:
+                    raise ThrottleError(
+                        "Too many retries (429 Too Many Requests)",
+                        retry_after=server_delay,
+                    )
+                if stream:
+                    response.close()  # hand the connection back before waiting
+                time.sleep(delay)
+                waited += delay
+                attempt += 1
                 continue
 
-            break
+            if throttle is not None:
+                throttle.recover()
+            return response
 
-        # Error handling
-        if response.status_code >= 400:
-            try:
-                payload = response.json()
-            except Exception:
-                payload = response.text or ""
-            raise TenableAPIError(
-                message="Tenable API error",
-                status_code=response.status_code,
-                payload=payload,
-            )
+    def _error(self, response) -> TenableAPIError:
+        try:
+            payload = response.json()
+        except Exception:
+            payload = response.text or ""
+        return TenableAPIError(
+            message="Tenable API error",
+            status_code=response.status_code,
+            payload=payload,
+        )
 
-        # No content
-        if response.status_code == 204:
-            return None
+    def _remember(self, key: str, body: bytes) -> None:
+        if self.GET_CACHE_TTL > 0:
+            self._lru_put(self._get_cache, key, (time.monotonic(), body), self.GET_CACHE_SIZE)
+
+    # ------------------------------------------------------------
+    # Raw streaming
+    # ------------------------------------------------------------
+    def stream(
+        self,
+        method: str,
+        path: str,
+        sink,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Copy a response body into `sink` (any object with .write(bytes))
+        chunk by chunk, without decoding it into Python objects.
 
-        # JSON response
+        Peak memory is one chunk rather than the whole payload plus its
+        parsed form. Throttling, retries and error wrapping match the
+        other verbs; the GET memo/ETag caches are not consulted.
+
+        Returns the number of (decompressed) bytes written.
+        """
+        if method != "GET":
+            self.invalidate()
+
+        response = self._send(
+            method, f"{self.BASE_URL}{path}", self._base_headers, params, json, stream=True
+        )
         try:
-            return response.json()
-        except ValueError:
-            raise TenableAPIError("Invalid JSON response from Tenable API.")
+            if response.status_code >= 400:
+                raise self._error(response)
+
+            written = 0
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                if chunk:
+                    sink.write(chunk)
+                    written += len(chunk)
+            return written
+        finally:
+            response.close()
 
     # ------------------------------------------------------------
     # Public verbs
@@ -108,11 +577,44 @@ class HTTPClient:
     def get(self, path: str, params: Optional[Dict[str, Any]] = None):
         return self._request("GET", path, params=params)
 
+    def get_full(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any, Any]:
+        """
+        GET returning (status, response headers, parsed body).
+
+        For callers that keep their own validators: `headers` (e.g.
+        If-None-Match) are added to the request, and a 304 comes back as
+        (304, headers, None) instead of being resolved from the in-memory
+        ETag cache, which is bypassed along with the GET memo.
+        """
+        request_headers = {**self._base_headers, **headers} if headers else self._base_headers
+        response = self._send("GET", f"{self.BASE_URL}{path}", request_headers, params, None)
+
+        status = response.status_code
+        if status >= 400:
+            raise self._error(response)
+
+        body = response.content
+        if status in (204, 304) or not body or body.isspace():
+            return status, response.headers, None
+
+        try:
+            return status, response.headers, json_loads(body)
+        except ValueError as exc:
+            raise TenableAPIError("Invalid JSON response from Tenable API.") from exc
+
     def post(self, path: str, json: Optional[Dict[str, Any]] = None):
         return self._request("POST", path, json_body=json)
 
     def put(self, path: str, json: Optional[Dict[str, Any]] = None):
         return self._request("PUT", path, json_body=json)
 
+    def patch(self, path: str, json: Optional[Dict[str, Any]] = None):
+        return self._request("PATCH", path, json_body=json)
+
     def delete(self, path: str):
         return self._request("DELETE", path)
@@ -7,21 +7,28 @@ They describe issues that impacted scan execution such as authentication failure
 timeouts, unreachable URLs, unexpected HTTP responses, or misconfiguration.
 
 This module provides:
-    - list notes for a single scan
-    - list notes for multiple scans (merged but labeled by scan_id)
+    - list notes for a single scan (all pages, or page-by-page via a generator)
+    - list notes for multiple scans concurrently (merged but labeled by scan_id)
     - flattening helpers for export (CSV/JSON-ready)
+    - a fused fetch + flatten + count stream for large exports
     - summary helpers
-    - optional cache usage
+    - optional cache usage (in-memory, plus an on-disk cache for notes of
+      completed scans)
 """
 
 import logging
-from typing import Dict, List, Optional
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from .errors import TenableAPIError
 from .cache import InMemoryCache
+from .utils import bounded_imap, bounded_map, json_dumps
 
 logger = logging.getLogger(__name__)
 
+# value types that get JSON-encoded by NotesAPI.flatten (exact-type lookup)
+_NESTED_TYPES = frozenset((dict, list))
+
 
 class NotesAPI:
     """
@@ -31,16 +38,45 @@ class NotesAPI:
         GET /was/v2/scans/{scan_id}/notes
     """
 
-    def __init__(self, http, cache: Optional[InMemoryCache] = None):
+    # Notes per scan are kept for CACHE_TTL seconds; at most CACHE_SIZE
+    # scans are held at once (least recently used are dropped first).
+    CACHE_TTL = 600
+    CACHE_SIZE = 1024
+
+    # Notes of scans in these states no longer change and may be persisted
+    FINAL_SCAN_STATUSES = frozenset({"completed"})
+
+    def __init__(
+        self,
+        http,
+        cache: Optional[InMemoryCache] = None,
+        disk_cache=None,
+        scans_api=None,
+    ):
+        """
+        Parameters
+        ----------
+        http : HTTPClient
+            Configured HTTP client.
+        cache : InMemoryCache, optional
+            Per-process cache (created if omitted).
+        disk_cache : DiskCache, optional
+            Persistent cache. Notes are only written to it for scans whose
+            status (looked up via scans_api) is in FINAL_SCAN_STATUSES.
+        scans_api : ScansAPI, optional
+            Needed for disk_cache writes; without it nothing is persisted.
+        """
         self.http = http
-        self.cache = cache or InMemoryCache()
+        self.cache = cache or InMemoryCache(maxsize=self.CACHE_SIZE)
+        self.disk_cache = disk_cache
+        self.scans = scans_api
 
     # ----------------------------------------------------------------------
     # Raw API
     # ----------------------------------------------------------------------
-    def _api_list_notes(self, scan_id: str) -> Dict:
+    def _api_list_notes(self, scan_id: str, limit: int = 200, offset: int = 0) -> Dict:
         """
-        Fetch notes for a single scan.
+        Fetch one page of notes for a single scan.
 
         Expected structure:
         {
@@ -57,57 +93,122 @@ class NotesAPI:
           ]
         }
         """
-        logger.info("Fetching notes for scan %s...", scan_id)
-        return self.http.get(f"/was/v2/scans/{scan_id}/notes")
+        logger.debug("Fetching notes for scan %s (offset %s)...", scan_id, offset)
+        return self.http.get(
+            f"/was/v2/scans/{scan_id}/notes",
+            params={"limit": limit, "offset": offset},
+        )
+
+    def _is_scan_final(self, scan_id: str) -> bool:
+        if self.scans is None:
+            return False
+        try:
+            status = self.scans.get_scan(scan_id).get("status")
+        except TenableAPIError as exc:
+            logger.debug("Could not read status of scan %s: %s", scan_id, exc)
+            return False
+        return str(status or "").lower() in self.FINAL_SCAN_STATUSES
 
     # ----------------------------------------------------------------------
     # Public API
     # ----------------------------------------------------------------------
+    def iter_note_pages(self, scan_id: str, limit: int = 200) -> Iterator[List[Dict]]:
+        """
+        Yield notes for a single scan one page at a time (uncached).
+        """
+        offset = 0
+
+        while True:
+            raw = self._api_list_notes(scan_id, limit=limit, offset=offset)
+            items = raw.get("items", [])
+
+            if items:
+                yield items
+
+            pagination = raw.get("pagination") or {}
+            total = pagination.get("total")
+            if not items or total is None:
+                return
+
+            server_offset = pagination.get("offset")
+            server_limit = pagination.get("limit")
+
+            if server_offset is not None and server_limit:
+                offset = server_offset + server_limit
+            else:
+                offset += len(items)
+
+            if offset >= total:
+                return
+
     def list_notes(self, scan_id: str, use_cache: bool = True) -> List[Dict]:
         """
         List all notes for a single scan (items only, not pagination).
 
+        Resolved memory -> disk -> network; notes of completed scans are
+        persisted when a disk cache is configured.
+
         Returns:
             List[Dict]
         """
         if use_cache:
             try:
-                cached = self.cache.get("notes", scan_id)
-                logger.debug("Loaded notes for scan %s from cache.", scan_id)
-                return cached
-            except Exception:
+                return self.cache.get("notes", scan_id)
+            except KeyError:
                 pass
 
-        raw = self._api_list_notes(scan_id)
-        items = raw.get("items", [])
+            if self.disk_cache is not None:
+                try:
+                    items = self.disk_cache.get("notes", scan_id)
+                    logger.debug("Loaded notes for scan %s from disk cache.", scan_id)
+                    self.cache.set("notes", scan_id, items, ttl=self.CACHE_TTL)
+                    return items
+                except KeyError:
+                    pass
+
+        items: List[Dict] = []
+        for page in self.iter_note_pages(scan_id):
+            items.extend(page)
 
-        # Cache for 10 minutes
-        self.cache.set("notes", scan_id, items, ttl=600)
+        self.cache.set("notes", scan_id, items, ttl=self.CACHE_TTL)
+
+        if self.disk_cache is not None and self._is_scan_final(scan_id):
+            self.disk_cache.set("notes", scan_id, items)
 
         logger.info("Loaded %s notes for scan %s", len(items), scan_id)
         return items
 
-    def list_notes_multi(self, scan_ids: List[str], use_cache: bool = True) -> List[Dict]:
+    def list_notes_multi(
+        self,
+        scan_ids: List[str],
+        use_cache: bool = True,
+        max_workers: int = 16,
+    ) -> List[Dict]:
         """
         Retrieve notes for multiple scan IDs.
 
+        Scans are fetched concurrently (up to `max_workers` at a time over
+        the shared connection pool); output keeps the order of `scan_ids`.
+
         Returns a flattened list where each record includes:
             scan_id, scan_note_id, severity, title, message, created_at, ...
 
         Perfect for export or bulk processing.
         """
-        all_notes: List[Dict] = []
-
-        for sid in scan_ids:
+        def _one(sid):
             try:
-                notes = self.list_notes(sid, use_cache=use_cache)
-                for n in notes:
-                    rec = dict(n)
-                    rec["scan_id"] = sid  # ensure labeling
-                    all_notes.append(rec)
+                return sid, self.list_notes(sid, use_cache=use_cache)
             except TenableAPIError as exc:
                 logger.error("Failed retrieving notes for scan %s: %s", sid, exc)
-                continue
+                return sid, []
+
+        all_notes: List[Dict] = []
+
+        for sid, notes in bounded_map(_one, scan_ids, max_workers=max_workers):
+            for n in notes:
+                rec = dict(n)
+                rec["scan_id"] = sid  # ensure labeling
+                all_notes.append(rec)
 
         logger.info("Collected %s total notes across %s scan(s).",
                     len(all_notes), len(scan_ids))
@@ -121,33 +222,79 @@ class NotesAPI:
         Notes are already essentially flat structures. This ensures:
 
             - all values are JSON-safe
-            - unexpected nested structures are stringified
+            - unexpected nested structures are JSON-encoded (CSV safety)
+
+        Nested values are found with one exact-type set lookup per value,
+        so the common all-scalar note costs a plain dict copy.
         """
-        flat = []
+        nested = _NESTED_TYPES
+        dumps = json_dumps
+
+        return [
+            {k: dumps(v) if type(v) in nested else v for k, v in n.items()}
+            for n in notes
+        ]
 
-        for n in notes:
-            row = {}
-            for k, v in n.items():
-                if isinstance(v, (dict, list)):
-                    # stringified for CSV safety
-                    row[k] = str(v)
-                else:
-                    row[k] = v
-            flat.append(row)
+    def stream_notes(
+        self,
+        scan_ids: Iterable[str],
+        counts: Optional[Counter] = None,
+        use_cache: bool = True,
+        max_workers: int = 16,
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield flattened, scan_id-labeled notes one scan at a time.
 
-        return flat
+        Up to `max_workers` scans are fetched concurrently ahead of the
+        consumer; pages are still yielded in `scan_ids` order. Flattening
+        and severity counting happen in a single pass over each scan's
+        notes, so exports never hold every note in memory and a summary
+        needs no second walk. When `counts` is given, it is updated in
+        place with lowercased severities; pass it to summarize_counts()
+        once the stream is exhausted.
+
+        Scans that fail are logged and skipped.
+        """
+        def _one(sid):
+            try:
+                return sid, self.list_notes(sid, use_cache=use_cache)
+            except TenableAPIError as exc:
+                logger.error("Failed retrieving notes for scan %s: %s", sid, exc)
+                return sid, None
+
+        nested = _NESTED_TYPES
+        dumps = json_dumps
+
+        for sid, notes in bounded_imap(_one, scan_ids, max_workers=max_workers):
+            if notes is None:
+                continue
+
+            page = []
+            for n in notes:
+                row = {k: dumps(v) if type(v) in nested else v for k, v in n.items()}
+                row["scan_id"] = sid
+                page.append(row)
+                if counts is not None:
+                    counts[(n.get("severity") or "").lower()] += 1
+
+            yield page
 
     # ----------------------------------------------------------------------
     # Export-all helper (high volume)
     # ----------------------------------------------------------------------
-    def list_all_notes(self, scan_ids: List[str], use_cache: bool = True) -> List[Dict]:
+    def list_all_notes(
+        self,
+        scan_ids: List[str],
+        use_cache: bool = True,
+        max_workers: int = 16,
+    ) -> List[Dict]:
         """
         Fetch all notes from all provided scans.
 
         This is used by CLI for "notes export-all", where scan_ids
         are determined dynamically by listing all scans first.
         """
-        return self.list_notes_multi(scan_ids, use_cache=use_cache)
+        return self.list_notes_multi(scan_ids, use_cache=use_cache, max_workers=max_workers)
 
     # ----------------------------------------------------------------------
     # Summary helper (optional)
@@ -166,18 +313,21 @@ class NotesAPI:
               "info": 0
             }
         """
-        result = {
-            "total": len(notes),
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0
-        }
-
-        for n in notes:
-            sev = (n.get("severity") or "").lower()
-            if sev in result:
-                result[sev] += 1
+        return self.summarize_counts(
+            Counter((n.get("severity") or "").lower() for n in notes)
+        )
 
-        return result
+    @staticmethod
+    def summarize_counts(counts: Counter) -> Dict:
+        """
+        Same shape as summarize(), from an already-accumulated Counter of
+        lowercased severities (see stream_notes).
+        """
+        return {
+            "total": sum(counts.values()),
+            "critical": counts["critical"],
+            "high": counts["high"],
+            "medium": counts["medium"],
+            "low": counts["low"],
+            "info": counts["info"]
+        }
@@ -4,25 +4,106 @@
 Tenable WAS v2 Plugins API
 
 Supports:
-    - Listing all plugins
+    - Listing all plugins (pagination-aware, or page-by-page via a generator)
     - Retrieving a single plugin
-    - Retrieving multiple plugins (comma-separated IDs)
+    - Retrieving multiple plugins (batched by ID, falling back to concurrent
+      per-ID requests)
     - Flattening plugins for CSV/JSON export
     - Uniform dictionary-based output (safe for Tenable field changes)
+    - An asyncio facade (AsyncPluginsAPI) for event-loop based callers
+    - Optional on-disk TTL cache for plugin metadata, with ETag revalidation
+      and stale fallback
 
 This module is intentionally simple:
     • No Pydantic models (plugin schemas vary frequently)
     • All methods return plain dicts or list[dict]
 """
 
+import asyncio
+import functools
 import logging
-from typing import List, Dict, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlencode
 
 from .errors import TenableAPIError
+from .utils import bounded_map, extend_columns, json_dumps
 
 logger = logging.getLogger(__name__)
 
 
+def _identity(val: Any) -> Any:
+    return val
+
+
+# DiskCache namespace holding the ETag last seen for each cached "plugins" key
+_ETAG_NAMESPACE = "plugins.etag"
+
+# Strings shorter than this are interned when flattened: enum-like values
+# ("high", "info", "Medium") repeat across every plugin in the catalog.
+_INTERN_MAX_LEN = 32
+
+
+def _intern_short(val: str) -> str:
+    return sys.intern(val) if len(val) < _INTERN_MAX_LEN else val
+
+
+def _join_list(val: List[Any]) -> str:
+    # Tag lists (CWE, WASC, OWASP) are usually all-str: join them directly
+    # and only pay for str() on each element when that fails.
+    try:
+        return ", ".join(val)
+    except TypeError:
+        return ", ".join(map(str, val))
+
+
+def _dump_dict(val: Dict[str, Any]) -> str:
+    try:
+        return json_dumps(val)
+    except Exception:
+        return str(val)
+
+
+# Value type -> flattening rule for _flatten_object (anything else is str()'d)
+_FLATTEN_DISPATCH = {
+    type(None): _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    str: _intern_short,
+    list: _join_list,
+    dict: _dump_dict,
+}
+
+# Most plugin records share a handful of (keys, value types) shapes.
+# _compile_flattener turns one shape into straight-line code; at most this
+# many shapes are compiled per PluginsAPI, the rest use the generic path.
+_MAX_COMPILED_FLATTENERS = 64
+
+
+def _compile_flattener(keys: Tuple[str, ...], types: Tuple[type, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a flattener specialised for records with exactly these keys and
+    value types. Produces the same dict as the generic _flatten_object
+    path, with the _FLATTEN_DISPATCH lookups resolved at compile time and
+    pass-through values copied without a call.
+    """
+    namespace: Dict[str, Any] = {}
+    items = []
+    for i, (key, typ) in enumerate(zip(keys, types)):
+        rule = _FLATTEN_DISPATCH.get(typ, str)
+        if rule is _identity:
+            items.append(f"{key!r}: o[{key!r}]")
+        else:
+            namespace[f"_r{i}"] = rule
+            items.append(f"{key!r}: _r{i}(o[{key!r}])")
+
+    source = "def _flatten(o):\n    return {" + ", ".join(items) + "}\n"
+    exec(compile(source, "<pytenable_was.plugins flattener>", "exec"), namespace)
+    return namespace["_flatten"]
+
+
 class PluginsAPI:
     """
     Lightweight Tenable WAS plugin metadata client.
@@ -32,29 +113,161 @@ class PluginsAPI:
         GET /was/v2/plugins/{plugin_id}
     """
 
-    def __init__(self, http):
+    # Disk cache lifetimes (seconds): listing pages change as plugins are
+    # added; a single plugin's metadata is effectively static.
+    LIST_CACHE_TTL = 30
+    PLUGIN_CACHE_TTL = 24 * 3600
+
+    # IDs per batched lookup; keeps the query string well under URL limits.
+    BATCH_SIZE = 200
+
+    def __init__(self, http, disk_cache=None, refresh: bool = False):
+        """
+        Parameters
+        ----------
+        http : HTTPClient
+            Configured HTTP client.
+        disk_cache : DiskCache, optional
+            Persistent cache for plugin metadata. If a refresh fails, the
+            last (expired) copy is served with a warning.
+        refresh : bool
+            Ignore cached entries (they are still rewritten).
+        """
         self.http = http
+        self.disk_cache = disk_cache
+        self.refresh = refresh
+        # Cleared the first time the server rejects the batched ID filter.
+        self._batch_supported = True
+        # (keys, value types) -> specialised flattener, see _compile_flattener
+        self._flatteners: Dict[Tuple[Any, ...], Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
 
     # ---------------------------------------------------------------
     # Raw API calls
     # ---------------------------------------------------------------
-    def _api_list_plugins(self) -> Dict[str, Any]:
-        logger.info("Fetching plugin list...")
-        return self.http.get("/was/v2/plugins")
+    def _get(self, path: str, params: Optional[Dict[str, Any]], ttl: float) -> Dict[str, Any]:
+        """
+        GET through the disk cache (when configured).
+
+        Expired entries are revalidated with the ETag the server sent for
+        them: a 304 reuses the cached body and restarts its TTL, so an
+        unchanged catalog page costs a round-trip but no transfer.
+        """
+        if self.disk_cache is None:
+            return self.http.get(path, params=params)
+
+        key = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+
+        etag = None
+        if not self.refresh:
+            try:
+                return self.disk_cache.get("plugins", key)
+            except KeyError:
+                pass
+            try:
+                etag = self.disk_cache.get(_ETAG_NAMESPACE, key)
+            except KeyError:
+                pass
+
+        try:
+            if etag:
+                status, headers, data = self.http.get_full(
+                    path, params=params, headers={"If-None-Match": etag}
+                )
+                if status == 304:
+                    try:
+                        data = self.disk_cache.get("plugins", key, stale=True)
+                    except KeyError:
+                        # validator outlived its body; fetch unconditionally
+                        status = None
+            if not etag or status is None:
+                status, headers, data = self.http.get_full(path, params=params)
+        except TenableAPIError as exc:
+            try:
+                data = self.disk_cache.get("plugins", key, stale=True)
+            except KeyError:
+                data = None
+            if data is None:
+                # nothing cached to fall back on: re-raise the API error
+                raise
+            logger.warning("Refreshing %s failed (%s); using stale cached copy.", path, exc)
+            return data
+
+        self.disk_cache.set("plugins", key, data, ttl=ttl)
+        new_etag = headers.get("ETag")
+        if new_etag:
+            self.disk_cache.set(_ETAG_NAMESPACE, key, new_etag)
+        elif etag and status != 304:
+            self.disk_cache.delete(_ETAG_NAMESPACE, key)
+        return data
+
+    def _api_list_plugins(self, limit: int = 200, offset: int = 0) -> Dict[str, Any]:
+        logger.debug("Fetching plugin list (offset %s)...", offset)
+        return self._get(
+            "/was/v2/plugins",
+            {"limit": limit, "offset": offset},
+            self.LIST_CACHE_TTL,
+        )
 
     def _api_get_plugin(self, plugin_id: str) -> Dict[str, Any]:
-        logger.info("Fetching plugin %s", plugin_id)
-        return self.http.get(f"/was/v2/plugins/{plugin_id}")
+        logger.debug("Fetching plugin %s", plugin_id)
+        return self._get(f"/was/v2/plugins/{plugin_id}", None, self.PLUGIN_CACHE_TTL)
+
+    def _api_get_batch(self, plugin_ids: List[str]) -> Dict[str, Any]:
+        logger.info("Fetching %s plugins in one request", len(plugin_ids))
+        return self.http.get(
+            "/was/v2/plugins",
+            params={
+                "filter.plugin_id.match": ",".join(plugin_ids),
+                "limit": len(plugin_ids),
+            },
+        )
 
     # ---------------------------------------------------------------
     # Public Methods
     # ---------------------------------------------------------------
+    def iter_plugin_pages(self, limit: int = 200) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield plugin metadata one page at a time.
+
+        Lets callers start processing (flattening, writing) the first page
+        while later pages are still being fetched.
+        """
+        offset = 0
+
+        while True:
+            raw = self._api_list_plugins(limit=limit, offset=offset)
+            items = raw.get("items") or raw.get("plugins") or []
+
+            if not isinstance(items, list):
+                raise TenableAPIError("Malformed plugin list response")
+
+            if items:
+                yield items
+
+            pagination = raw.get("pagination") or {}
+            total = pagination.get("total")
+            if not items or total is None:
+                return
+
+            server_offset = pagination.get("offset")
+            server_limit = pagination.get("limit")
+
+            if server_offset is not None and server_limit:
+                offset = server_offset + server_limit
+            else:
+                offset += len(items)
+
+            if offset >= total:
+                return
+
     def list_plugins(self) -> List[Dict[str, Any]]:
         """
-        Return a list of plugin metadata dictionaries.
+        Return a list of plugin metadata dictionaries (all pages).
         """
-        raw = self._api_list_plugins()
-        return raw.get("items") or raw.get("plugins") or []
+        results: List[Dict[str, Any]] = []
+        for page in self.iter_plugin_pages():
+            results.extend(page)
+        return results
 
     def get_plugin(self, plugin_id: str) -> Dict[str, Any]:
         """
@@ -65,21 +278,98 @@ class PluginsAPI:
     # ---------------------------------------------------------------
     # Multi-ID Support (for CLI)
     # ---------------------------------------------------------------
-    def get_multiple(self, plugin_ids: List[str]) -> List[Dict[str, Any]]:
+    def get_batch(self, plugin_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Retrieve several plugins with a single list request filtered by ID.
+
+        Returns the matching plugin dicts (server order). IDs the server
+        does not know are simply absent. Raises TenableAPIError if the
+        request fails or the server rejects the filter.
+        """
+        raw = self._api_get_batch(plugin_ids)
+        items = raw.get("items") or raw.get("plugins") or []
+
+        if not isinstance(items, list):
+            raise TenableAPIError("Malformed plugin list response")
+
+        return items
+
+    def _get_batched(self, plugin_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up `plugin_ids` BATCH_SIZE at a time. Returns {id: plugin} for
+        the IDs found; an empty dict if batching is unavailable.
+        """
+        wanted = set(plugin_ids)
+        found: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            for start in range(0, len(plugin_ids), self.BATCH_SIZE):
+                matched = 0
+                for item in self.get_batch(plugin_ids[start:start + self.BATCH_SIZE]):
+                    pid = str(item.get("plugin_id") or item.get("id"))
+                    # Guard against a server that ignores the filter.
+                    if pid in wanted:
+                        found[pid] = item
+                        matched += 1
+                if not matched:
+                    # Nothing we asked for came back: the filter is being
+                    # ignored, so further batches would be wasted requests.
+                    logger.info("Batched plugin lookup returned none of the requested IDs; using per-ID requests.")
+                    self._batch_supported = False
+                    break
+        except TenableAPIError as exc:
+            if exc.status_code in (400, 404):
+                logger.info("Batched plugin lookup not supported (%s); using per-ID requests.", exc)
+                self._batch_supported = False
+            else:
+                logger.warning("Batched plugin lookup failed (%s); using per-ID requests.", exc)
+            return {}
+
+        if self.disk_cache is not None:
+            for pid, item in found.items():
+                self.disk_cache.set("plugins", f"/was/v2/plugins/{pid}", item, ttl=self.PLUGIN_CACHE_TTL)
+
+        return found
+
+    def get_multiple(self, plugin_ids: List[str], max_workers: int = 16) -> List[Dict[str, Any]]:
         """
         Retrieve multiple plugin IDs.
 
+        Cached plugins are served from the disk cache; the rest are fetched
+        with batched list requests (get_batch). IDs the batch did not
+        return — or all of them, if the server rejects the batch filter —
+        are fetched individually, up to `max_workers` in flight at once
+        over the shared connection pool. Results keep the order of
+        `plugin_ids`.
+
         Ensures the return type is always a list[dict].
         """
-        results = []
-        for pid in plugin_ids:
+        plugin_ids = [str(pid) for pid in plugin_ids]
+        found: Dict[str, Dict[str, Any]] = {}
+
+        if self.disk_cache is not None and not self.refresh:
+            for pid in plugin_ids:
+                try:
+                    found[pid] = self.disk_cache.get("plugins", f"/was/v2/plugins/{pid}")
+                except KeyError:
+                    pass
+
+        missing = list(dict.fromkeys(pid for pid in plugin_ids if pid not in found))
+        if len(missing) > 1 and self._batch_supported:
+            found.update(self._get_batched(missing))
+
+        def _one(pid):
             try:
-                results.append(self.get_plugin(pid))
+                return self.get_plugin(pid)
             except TenableAPIError as exc:
                 # We do NOT raise — we return partial results and record error.
                 logger.error("Failed to retrieve plugin %s: %s", pid, exc)
-                results.append({"plugin_id": pid, "error": str(exc)})
-        return results
+                return {"plugin_id": pid, "error": str(exc)}
+
+        missing = [pid for pid in missing if pid not in found]
+        found.update(zip(missing, bounded_map(_one, missing, max_workers=max_workers)))
+
+        return [found[pid] for pid in plugin_ids]
 
     # ---------------------------------------------------------------
     # Flattening for export (CSV/JSON)
@@ -92,38 +382,28 @@ class PluginsAPI:
         Nested dicts are JSON-encoded.
 
         This keeps export files safe for Splunk, pandas, CSV, etc.
-        """
-        flat = {}
-
-        for key, val in obj.items():
-            # nulls → None
-            if val is None:
-                flat[key] = None
-                continue
+        Each value costs one exact-type lookup in _FLATTEN_DISPATCH.
 
-            # simple types
-            if isinstance(val, (int, float, str, bool)):
-                flat[key] = val
-                continue
+        Keys and short string values are interned, so a flattened catalog
+        shares one copy of each column name and enum-like value instead of
+        one per plugin (JSON decoders only share keys within a response).
 
-            # lists → comma-separated
-            if isinstance(val, list):
-                flat[key] = ", ".join(str(v) for v in val)
-                continue
-
-            # nested dicts → JSON string
-            if isinstance(val, dict):
-                try:
-                    import json
-                    flat[key] = json.dumps(val, ensure_ascii=False)
-                except Exception:
-                    flat[key] = str(val)
-                continue
+        Records whose (keys, value types) shape has been seen before go
+        through a flattener compiled for that shape, which skips the
+        per-value dispatch; its key constants are likewise shared.
+        """
+        shape = (tuple(obj), tuple(map(type, obj.values())))
+        flatten = self._flatteners.get(shape)
+        if flatten is not None:
+            return flatten(obj)
 
-            # fallback — stringify
-            flat[key] = str(val)
+        if len(self._flatteners) < _MAX_COMPILED_FLATTENERS and all(type(k) is str for k in shape[0]):
+            flatten = self._flatteners[shape] = _compile_flattener(*shape)
+            return flatten(obj)
 
-        return flat
+        dispatch = _FLATTEN_DISPATCH.get
+        intern = sys.intern
+        return {intern(key): dispatch(type(val), str)(val) for key, val in obj.items()}
 
     # ---------------------------------------------------------------
     # Flatten single plugin
@@ -138,19 +418,101 @@ class PluginsAPI:
     # ---------------------------------------------------------------
     # Flatten all plugins
     # ---------------------------------------------------------------
+    def iter_flatten_all(self, limit: int = 200) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield flattened plugins one page at a time (streaming exports).
+        """
+        for page in self.iter_plugin_pages(limit=limit):
+            yield [self._flatten_object(p) for p in page]
+
     def flatten_all(self) -> List[Dict[str, Any]]:
         """
         Retrieve all plugins and return flattened list.
         """
-        items = self.list_plugins()
-        return [self._flatten_object(p) for p in items]
+        rows: List[Dict[str, Any]] = []
+        for page in self.iter_flatten_all():
+            rows.extend(page)
+        return rows
+
+    def flatten_all_columnar(self) -> Dict[str, List[Any]]:
+        """
+        Retrieve all plugins as flattened columns: {column: [value per plugin]}.
+
+        Columns appear in first-seen order; plugins lacking a column get
+        None. The result can be handed to utils.write_csv_columns,
+        utils.write_parquet_columns or pandas.DataFrame directly, without one dict per plugin.
+        """
+        columns: Dict[str, List[Any]] = {}
+        for page in self.iter_flatten_all():
+            extend_columns(columns, page)
+        return columns
 
     # ---------------------------------------------------------------
     # Flatten multiple specific plugin IDs
     # ---------------------------------------------------------------
-    def flatten_multiple(self, plugin_ids: List[str]) -> List[Dict[str, Any]]:
+    def flatten_multiple(self, plugin_ids: List[str], max_workers: int = 16) -> List[Dict[str, Any]]:
         """
         Retrieve + flatten specific plugins (multi-ID support).
         """
-        objs = self.get_multiple(plugin_ids)
+        objs = self.get_multiple(plugin_ids, max_workers=max_workers)
         return [self._flatten_object(o) for o in objs]
+
+    # Short name used by the CLI; same method.
+    flatten_multi = flatten_multiple
+
+
+class AsyncPluginsAPI:
+    """
+    asyncio facade over PluginsAPI.
+
+    Each call runs the synchronous client on a private worker pool via
+    loop.run_in_executor, so awaiting plugin lookups never blocks the
+    event loop, while requests still share the HTTPClient's connection
+    pool, throttle and retry logic. `max_concurrency` bounds how many
+    requests are in flight at once.
+
+        api = AsyncPluginsAPI(http)
+        plugins = await api.get_multiple(["98000", "98001"])
+    """
+
+    def __init__(self, http, max_concurrency: int = 16, disk_cache=None):
+        self.sync = PluginsAPI(http, disk_cache=disk_cache)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pytenable-was-async"
+        )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def list_plugins(self) -> List[Dict[str, Any]]:
+        return await self._run(self.sync.list_plugins)
+
+    async def get_plugin(self, plugin_id: str) -> Dict[str, Any]:
+        return await self._run(self.sync.get_plugin, plugin_id)
+
+    async def get_multiple(self, plugin_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Same contract as PluginsAPI.get_multiple: input order, failed IDs
+        returned as {"plugin_id", "error"} instead of raising.
+        """
+        results = await asyncio.gather(
+            *(self.get_plugin(pid) for pid in plugin_ids), return_exceptions=True
+        )
+
+        out: List[Dict[str, Any]] = []
+        for pid, res in zip(plugin_ids, results):
+            if isinstance(res, TenableAPIError):
+                logger.error("Failed to retrieve plugin %s: %s", pid, res)
+                res = {"plugin_id": pid, "error": str(res)}
+            elif isinstance(res, BaseException):
+                raise res
+            out.append(res)
+        return out
+
+    async def flatten_multiple(self, plugin_ids: List[str]) -> List[Dict[str, Any]]:
+        objs = await self.get_multiple(plugin_ids)
+        return [self.sync._flatten_object(o) for o in objs]
@@ -7,20 +7,21 @@ Supports:
     • List scans
     • Retrieve scan details
     • Change owner for a single scan
-    • Bulk owner change for many scans
+    • Bulk owner change for many scans (concurrent)
     • Export all scan details to JSON/CSV
     • Flattening for Splunk/DataFrame ingestion
-    • Pagination-safe full scan listing
+    • Pagination-safe full scan listing, or page-by-page via a generator
     • tqdm progress for long operations
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from tqdm import tqdm
 
 from .errors import TenableAPIError
 from .utils import (
+    bounded_imap,
     flatten_dict,
     write_json_safe,
     write_csv_safe,
@@ -100,9 +101,12 @@ class ScansAPI:
     # PUBLIC: LIST SCANS
     # ----------------------------------------------------------------------
 
-    def list_scans(self, limit: int = 200) -> List[Dict[str, Any]]:
+    def iter_scan_pages(self, limit: int = 200) -> Iterator[List[Dict[str, Any]]]:
         """
-        Retrieve ALL scans (pagination-aware).
+        Yield scans one page at a time (pagination-aware).
+
+        Each page is yielded as soon as it arrives, so callers can start
+        printing or writing before the last page has been fetched.
         """
         first = self._api_list_scans(limit=limit, offset=0)
 
@@ -113,10 +117,11 @@ class ScansAPI:
         if not isinstance(items, list):
             raise TenableAPIError("Malformed scans payload: items not a list")
 
-        results = list(items)
+        if items:
+            yield items
 
         if total <= len(items):
-            return results
+            return
 
         pbar = tqdm(
             total=total,
@@ -125,29 +130,37 @@ class ScansAPI:
             desc="Collecting scans",
         )
 
-        offset = len(items)
-
-        while offset < total:
-            page = self._api_list_scans(limit=limit, offset=offset)
-            page_items = page.get("items", [])
+        try:
+            offset = len(items)
 
-            if not page_items:
-                break
+            while offset < total:
+                page = self._api_list_scans(limit=limit, offset=offset)
+                page_items = page.get("items", [])
 
-            results.extend(page_items)
-            pbar.update(len(page_items))
+                if not page_items:
+                    break
 
-            pagination = page.get("pagination") or {}
-            server_offset = pagination.get("offset")
-            server_limit = pagination.get("limit")
+                pbar.update(len(page_items))
+                yield page_items
 
-            if server_offset is not None and server_limit:
-                offset = server_offset + server_limit
-            else:
-                offset += len(page_items)
+                pagination = page.get("pagination") or {}
+                server_offset = pagination.get("offset")
+                server_limit = pagination.get("limit")
 
-        pbar.close()
+                if server_offset is not None and server_limit:
+                    offset = server_offset + server_limit
+                else:
+                    offset += len(page_items)
+        finally:
+            pbar.close()
 
+    def list_scans(self, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Retrieve ALL scans (pagination-aware).
+        """
+        results: List[Dict[str, Any]] = []
+        for page in self.iter_scan_pages(limit=limit):
+            results.extend(page)
         return results
 
     # ----------------------------------------------------------------------
@@ -181,23 +194,36 @@ class ScansAPI:
         self,
         scan_ids: List[str],
         new_owner_id: str,
+        max_workers: int = 16,
     ) -> List[Dict[str, Any]]:
         """
         Update owner for many scans with progress tracking.
-        """
-        results: List[Dict[str, Any]] = []
 
-        for scan_id in tqdm(scan_ids, desc="Updating scan owners", unit="scan"):
-            resp = self.change_owner(scan_id, new_owner_id)
-            results.append(
-                {
-                    "scan_id": scan_id,
-                    "new_owner": new_owner_id,
-                    "status": "ok",
-                }
-            )
-
-        return results
+        Up to `max_workers` PATCH requests are in flight at once over the
+        shared connection pool. A failing scan does not stop the others;
+        results keep the order of `scan_ids` and failed entries carry
+        "status": "error" plus the error message.
+        """
+        def _one(scan_id):
+            try:
+                self.change_owner(scan_id, new_owner_id)
+            except TenableAPIError as exc:
+                logger.error("Failed to change owner of scan %s: %s", scan_id, exc)
+                return {"scan_id": scan_id, "new_owner": new_owner_id, "status": "error", "error": str(exc)}
+            return {"scan_id": scan_id, "new_owner": new_owner_id, "status": "ok"}
+
+        results = bounded_imap(_one, scan_ids, max_workers=max_workers)
+        # redraw at most twice a second (and every ~0.5% of the scans), not
+        # once per completed PATCH
+        return list(tqdm(
+            results,
+            total=len(scan_ids),
+            desc="Updating scan owners",
+            unit="scan",
+            mininterval=0.5,
+            miniters=max(1, len(scan_ids) // 200),
+            smoothing=0.1,
+        ))
 
     # ----------------------------------------------------------------------
     # EXPORT SCAN DETAILS
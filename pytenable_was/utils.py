@@ -10,16 +10,41 @@ This module provides:
     - timestamp parsing and formatting helpers
     - severity ranking, sorting, and grouping
     - flattening helpers for CSV/JSON exports
+    - fast JSON encode/decode (orjson when installed, stdlib otherwise)
     - JSON pretty-printing for CLI/log output
-
-All helpers are intentionally fast, predictable, and dependency-free.
+    - safe (atomic) and streaming JSON/JSON Lines/CSV file writers
+    - column-oriented CSV/Parquet writers (Parquet needs pyarrow)
+    - background page prefetching for export pipelines
+    - bounded concurrent fan-out for independent API calls (eager or lazy)
+
+All helpers are intentionally fast, predictable, and dependency-free
+(orjson and ciso8601 are optional accelerators:
+`pip install pytenable-was[fast]`).
 """
 
+import csv
+import itertools
 import json
 import logging
+import os
+import queue
 import re
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator
+    orjson = None
+
+try:
+    import ciso8601
+except ImportError:  # optional accelerator
+    ciso8601 = None
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +151,15 @@ def safe_get(data: Any, *keys, default=None):
 # TIME HELPERS
 # ======================================================================
 
+_EPOCH_REGEX = re.compile(r"[+-]?\d+")
+
+
+def _parse_iso(text: str) -> datetime:
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(text)
+    return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
 def parse_timestamp(ts: Any) -> Optional[int]:
     """
     Parse a timestamp from Tenable WAS payloads into epoch seconds (int).
@@ -135,6 +169,10 @@ def parse_timestamp(ts: Any) -> Optional[int]:
         - str containing an integer epoch
         - ISO8601 string (e.g., '2025-01-01T12:00:00Z')
 
+    ISO strings are parsed with ciso8601 when installed, otherwise with
+    datetime.fromisoformat. Numeric strings are recognized up front, so
+    ISO input no longer pays for a failed int() first.
+
     Returns:
         - epoch seconds as int, or
         - None if parsing fails
@@ -142,16 +180,21 @@ def parse_timestamp(ts: Any) -> Optional[int]:
     if ts is None:
         return None
 
-    # Already an int-like?
-    try:
-        return int(ts)
-    except Exception:
-        pass
+    if isinstance(ts, str):
+        text = ts.strip()
+        if _EPOCH_REGEX.fullmatch(text):
+            return int(text)
+    else:
+        # Already an int-like?
+        try:
+            return int(ts)
+        except Exception:
+            pass
+        text = str(ts)
 
     # ISO8601-style string
     try:
-        dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-        return int(dt.timestamp())
+        return int(_parse_iso(text).timestamp())
     except Exception:
         logger.debug("Unsupported timestamp format: %s", ts)
         return None
@@ -204,6 +247,14 @@ SEVERITY_ORDER = {
     "info": 0,
 }
 
+# Rank lookup that also covers the common spellings seen in payloads
+# ("High", "HIGH"), so most lookups skip the str.lower() call.
+_SEVERITY_RANK_ANYCASE = {
+    variant: rank
+    for sev, rank in SEVERITY_ORDER.items()
+    for variant in (sev, sev.upper(), sev.capitalize())
+}
+
 
 def severity_rank(sev: Optional[str]) -> int:
     """
@@ -220,25 +271,36 @@ def severity_rank(sev: Optional[str]) -> int:
 
 
 def sort_by_severity(
-    findings: List[Dict[str, Any]],
+    findings: List[Any],
     key: str = "severity",
     reverse: bool = True,
-) -> List[Dict[str, Any]]:
+) -> List[Any]:
     """
-    Sort a list of finding dicts by severity rank.
+    Sort findings by severity rank.
 
     Args:
         findings:
-            List of dicts; each dict *should* have `key` (default 'severity').
+            List of dicts with a `key` field, or objects with a `key`
+            attribute (default 'severity'); no conversion to dict needed.
         key:
-            Field name holding severity string in each finding.
+            Field/attribute name holding the severity string.
         reverse:
             Whether to sort from highest to lowest severity (default True).
 
     Returns:
         New list sorted according to severity_rank().
     """
-    return sorted(findings, key=lambda f: severity_rank(f.get(key)), reverse=reverse)
+    fast_rank = _SEVERITY_RANK_ANYCASE.get
+    slow_rank = SEVERITY_ORDER.get
+
+    def _rank(f: Any) -> int:
+        sev = f.get(key) if isinstance(f, dict) else getattr(f, key, None)
+        if not sev:
+            return -1
+        r = fast_rank(sev)
+        return r if r is not None else slow_rank(str(sev).lower(), -1)
+
+    return sorted(findings, key=_rank, reverse=reverse)
 
 
 def group_by_severity(findings: List[Any]) -> Dict[str, List[Any]]:
@@ -261,21 +323,17 @@ def group_by_severity(findings: List[Any]) -> Dict[str, List[Any]]:
             }
     """
     groups: Dict[str, List[Any]] = {k: [] for k in SEVERITY_ORDER}
-    groups["unknown"] = []
+    unknown = groups["unknown"] = []
+    bucket_for = groups.get
 
     for f in findings:
-        if hasattr(f, "severity"):
-            sev_val = getattr(f, "severity", "")
-        elif isinstance(f, dict):
-            sev_val = f.get("severity", "")
+        if isinstance(f, dict):
+            sev_val = f.get("severity")
         else:
-            sev_val = ""
+            sev_val = getattr(f, "severity", None)
 
-        sev = str(sev_val).lower()
-        if sev in groups:
-            groups[sev].append(f)
-        else:
-            groups["unknown"].append(f)
+        bucket = bucket_for(str(sev_val).lower()) if sev_val else None
+        (unknown if bucket is None else bucket).append(f)
 
     return groups
 
@@ -308,6 +366,120 @@ def flatten_dict(
     return flattened
 
 
+def flatten_keys(
+    data: Dict[str, Any],
+    parent_key: str = "",
+    sep: str = ".",
+) -> Iterator[str]:
+    """
+    Yield the keys flatten_dict() would produce, in the same order,
+    without building the flattened dict.
+
+    Used to discover CSV headers in a cheap first pass so rows can then
+    be flattened and written one at a time.
+    """
+    for k, v in data.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            yield from flatten_keys(v, new_key, sep=sep)
+        else:
+            yield new_key
+
+
+# Max record shapes flatten_dicts compiles per call; rarer shapes fall
+# back to flatten_dict.
+_MAX_COMPILED_SHAPES = 4
+
+
+def _compile_dict_flattener(
+    sample: Dict[str, Any],
+    sep: str = ".",
+) -> Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """
+    Build a function that flattens records shaped like `sample` (same
+    keys at every nesting level) with straight-line lookups instead of
+    flatten_dict's recursive walk.
+
+    The function returns None, or raises KeyError, for a record of a
+    different shape. Returns None (nothing compiled) if `sample` has
+    non-str keys.
+    """
+    checks: List[str] = []
+    exprs: List[str] = []
+    keys: List[str] = []
+    counter = itertools.count()
+
+    def walk(d: Dict[str, Any], var: str, prefix: str) -> bool:
+        checks.append(f"    if len({var}) != {len(d)}: return None")
+        for k, v in d.items():
+            if type(k) is not str:
+                return False
+            if isinstance(v, dict):
+                sub = f"d{next(counter)}"
+                checks.append(f"    {sub} = {var}[{k!r}]")
+                checks.append(f"    if type({sub}) is not dict: return None")
+                if not walk(v, sub, f"{prefix}{k}{sep}"):
+                    return False
+            else:
+                exprs.append(f"{var}[{k!r}]")
+                keys.append(prefix + k)
+        return True
+
+    if not walk(sample, "d", ""):
+        return None
+
+    # A leaf that holds a dict in this record was a scalar in the sample:
+    # it needs flattening, so the record takes the generic path.
+    source = (
+        "def _flatten(d):\n"
+        + "\n".join(checks)
+        + "\n    vals = (" + "".join(f"{e}, " for e in exprs) + ")\n"
+        + "    if dict in map(type, vals): return None\n"
+        + "    return dict(zip(_keys, vals))\n"
+    )
+    namespace: Dict[str, Any] = {"_keys": tuple(keys)}
+    exec(compile(source, "<pytenable_was.utils flattener>", "exec"), namespace)
+    return namespace["_flatten"]
+
+
+def flatten_dicts(rows: Iterable[Dict[str, Any]], sep: str = ".") -> Iterator[Dict[str, Any]]:
+    """
+    Yield flatten_dict(row, sep=sep) for each row.
+
+    Records from one API response usually share a few shapes (e.g. an
+    optional sub-object present or null). Each new shape, up to
+    _MAX_COMPILED_SHAPES, is compiled once into a specialised flattener;
+    matching rows then skip the recursive walk and key formatting.
+    For JSON-decoded records each row equals flatten_dict(row); its key
+    order follows the first record of that shape (records of one API
+    response list their keys in the same order, so in practice it
+    matches too).
+    """
+    flatteners: List[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = []
+    can_compile = True
+
+    for row in rows:
+        flat = None
+        for flatten in flatteners:
+            try:
+                flat = flatten(row)
+            except KeyError:
+                continue
+            if flat is not None:
+                break
+
+        if flat is None:
+            if can_compile and len(flatteners) < _MAX_COMPILED_SHAPES:
+                flatten = _compile_dict_flattener(row, sep)
+                if flatten is None:
+                    can_compile = False
+                else:
+                    flatteners.append(flatten)
+            flat = flatten_dict(row, sep=sep)
+
+        yield flat
+
+
 def flatten_model(model: Any) -> Dict[str, Any]:
     """
     Convert a Pydantic model or plain dict into a flat dict.
@@ -328,6 +500,38 @@ def flatten_model(model: Any) -> Dict[str, Any]:
     return flatten_dict(data)
 
 
+# ======================================================================
+# JSON ENCODE / DECODE
+# ======================================================================
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON from bytes or str.
+
+    Uses orjson when available. Raises ValueError on malformed input
+    (orjson.JSONDecodeError subclasses ValueError, as does the stdlib's).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any, indent: bool = False) -> str:
+    """
+    Encode data as a UTF-8 JSON string (non-ASCII kept as-is).
+
+    Uses orjson when available; values orjson refuses (non-str keys,
+    integers beyond 64 bits, ...) fall back to the stdlib encoder.
+    `indent=True` produces 2-space indentation.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None)
+
+
 # ======================================================================
 # JSON PRETTY PRINT
 # ======================================================================
@@ -336,13 +540,535 @@ def pretty_json(data: Any) -> str:
     """
     Return pretty-printed JSON for structured data.
 
-    - Uses json.dumps(indent=2, sort_keys=True).
+    - 2-space indent, sorted keys, non-ASCII kept as-is.
+    - Uses orjson when available, json.dumps otherwise.
     - Falls back to str(data) if serialization fails.
 
     Intended for CLI output and logging where human-readable JSON
     is helpful for debugging or inspection.
     """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode("utf-8")
+        except TypeError:
+            pass
     try:
-        return json.dumps(data, indent=2, sort_keys=True)
+        return json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
     except Exception:
         return str(data)
+
+
+# ======================================================================
+# FILE WRITERS (JSON / CSV)
+# ======================================================================
+
+def timestamp_filename(prefix: str, ext: str) -> str:
+    """
+    Build an export filename of the form:
+        <prefix>_<YYYYmmdd_HHMMSS>.<ext>
+    """
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{prefix}_{stamp}.{ext}"
+
+
+# Buffer size for the streaming writers: row-at-a-time writes are coalesced
+# into ~1 MiB write() calls instead of the 8 KiB default.
+_WRITE_BUFFER = 1 << 20
+
+
+def _tmp_path(path: str) -> str:
+    parent = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent, exist_ok=True)
+    return f"{path}.tmp"
+
+
+def write_json_safe(path: str, data: Any) -> str:
+    """
+    Write data as pretty-printed JSON.
+
+    The file is written to `<path>.tmp` first and atomically moved into
+    place, so a failed export never leaves a truncated file behind.
+    With orjson, the encoded bytes are written as-is (no str round trip).
+    """
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    if payload is None:
+        payload = json_dumps(data, indent=True).encode("utf-8")
+
+    tmp = _tmp_path(path)
+    with open(tmp, "wb") as fh:
+        fh.write(payload)
+    os.replace(tmp, path)
+    return path
+
+
+def write_raw_safe(path: str, fill: Callable[[Any], Any]) -> str:
+    """
+    Write raw bytes produced by `fill(fh)` (fh is a binary file object),
+    with the same temp-file + atomic-move guarantee as write_json_safe.
+
+    Used to save API responses verbatim via HTTPClient.stream(); since
+    `fill` usually does network I/O, the partial temp file is removed if
+    it fails.
+    """
+    tmp = _tmp_path(path)
+    try:
+        with open(tmp, "wb") as fh:
+            fill(fh)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp, path)
+    return path
+
+
+def _csv_fieldnames(rows: List[Dict[str, Any]]) -> List[str]:
+    """
+    Ordered union of keys across rows (first-seen order).
+    """
+    fieldnames: Dict[str, None] = {}
+    for row in rows:
+        for k in row:
+            fieldnames.setdefault(k, None)
+    return list(fieldnames)
+
+
+def _csv_values(rows: Iterable[Dict[str, Any]], fieldnames: List[str]) -> Iterator[Iterator[Any]]:
+    """
+    Turn dict rows into value sequences ordered by `fieldnames`.
+
+    Equivalent to csv.DictWriter(restval="", extrasaction="ignore") but
+    without its per-row extra-keys set difference; the per-cell lookup
+    is a C-level map over dict.get.
+    """
+    blank = itertools.repeat("")
+    for row in rows:
+        yield map(row.get, fieldnames, blank)
+
+
+def write_csv_safe(
+    path: str,
+    rows: List[Dict[str, Any]],
+    fieldnames: Optional[List[str]] = None,
+) -> str:
+    """
+    Write a list of flat dicts to CSV.
+
+    - Header is `fieldnames` when given (keys outside it are ignored),
+      otherwise the ordered union of keys across all rows.
+    - Missing values are written as empty cells.
+    - Written via `<path>.tmp` + atomic replace.
+    """
+    tmp = _tmp_path(path)
+    with open(tmp, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER) as fh:
+        if fieldnames is None:
+            fieldnames = _csv_fieldnames(rows)
+        writer = csv.writer(fh)
+        writer.writerow(fieldnames)
+        writer.writerows(_csv_values(rows, fieldnames))
+    os.replace(tmp, path)
+    return path
+
+
+def write_csv_columns(path: str, columns: Dict[str, List[Any]]) -> str:
+    """
+    Write column-oriented data ({column: [value per row]}) to CSV.
+
+    Rows are produced by zip() over the column lists, so no per-row dict
+    is built or looked up. All columns must have the same length; None is
+    written as an empty cell. Atomic via `<path>.tmp` + replace.
+    """
+    tmp = _tmp_path(path)
+    with open(tmp, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(columns)
+        writer.writerows(zip(*columns.values()))
+    os.replace(tmp, path)
+    return path
+
+
+def extend_columns(columns: Dict[str, List[Any]], rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    Append flat dict rows to column-oriented `columns` in place.
+
+    New columns are back-filled with None for earlier rows; rows missing
+    a column get None.
+    """
+    count = len(next(iter(columns.values()))) if columns else 0
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns[key] = [None] * count
+        get = row.get
+        for key, col in columns.items():
+            col.append(get(key))
+        count += 1
+
+
+def _import_pyarrow():
+    """
+    Return (pyarrow, pyarrow.parquet), imported on first use: pyarrow is an
+    optional, comparatively slow-to-import dependency.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Parquet output requires pyarrow: pip install 'pytenable-was[parquet]'"
+        ) from None
+    return pyarrow, pyarrow.parquet
+
+
+def write_parquet_columns(path: str, columns: Dict[str, List[Any]]) -> str:
+    """
+    Write column-oriented data to a Parquet file (requires pyarrow).
+
+    Column types are inferred by pyarrow; a column mixing value types is
+    stored as strings. Atomic via `<path>.tmp` + replace.
+    """
+    pa, pq = _import_pyarrow()
+
+    arrays = {}
+    for name, values in columns.items():
+        try:
+            arrays[name] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[name] = pa.array(
+                [None if v is None else str(v) for v in values], type=pa.string()
+            )
+
+    tmp = _tmp_path(path)
+    pq.write_table(pa.table(arrays), tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def write_csv_rows(
+    path: str,
+    fieldnames: List[str],
+    rows: Iterable[Dict[str, Any]],
+) -> str:
+    """
+    Write rows to CSV with a known header, consuming `rows` lazily.
+
+    Only one row needs to exist at a time, so `rows` can be a generator
+    that flattens records on the fly. Missing values are written as
+    empty cells; atomic via `<path>.tmp` + replace.
+    """
+    tmp = _tmp_path(path)
+    with open(tmp, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER) as fh:
+        writer = csv.writer(fh)
+        writer.writerow(fieldnames)
+        writer.writerows(_csv_values(rows, fieldnames))
+    os.replace(tmp, path)
+    return path
+
+
+def _json_array_pages(fh, pages: Iterable[List[Any]]) -> Iterator[List[Any]]:
+    """
+    Write pages of records to `fh` as one JSON array, yielding each page
+    once it has been written. The closing bracket is written when `pages`
+    is exhausted.
+    """
+    fh.write("[")
+    first = True
+    for page in pages:
+        for record in page:
+            fh.write("\n  " if first else ",\n  ")
+            fh.write(json_dumps(record))
+            first = False
+        yield page
+    fh.write("]\n" if first else "\n]\n")
+
+
+def write_csv_spooled(
+    path: str,
+    rows: Iterable[Dict[str, Any]],
+    trailing: Iterable[str] = (),
+) -> str:
+    """
+    Write flat dict rows to CSV with the full column union as header,
+    without holding the rows in memory.
+
+    Rows are spooled to an anonymous temporary file (JSON Lines) while
+    the header is collected, then written out in a second pass. Columns
+    named in `trailing` always come last. Output matches write_csv_safe.
+    """
+    trailing = list(trailing)
+    fieldnames: Dict[str, None] = {}
+    with tempfile.TemporaryFile() as spool:
+        for row in rows:
+            for k in row:
+                fieldnames.setdefault(k, None)
+            spool.write(json_dumps(row).encode("utf-8"))
+            spool.write(b"\n")
+
+        for k in trailing:
+            fieldnames.pop(k, None)
+        header = list(fieldnames) + trailing
+
+        spool.seek(0)
+        write_csv_rows(path, header, (json_loads(line) for line in spool))
+    return path
+
+
+def write_json_stream(path: str, pages: Iterable[List[Any]]) -> str:
+    """
+    Stream pages of records into a single JSON array.
+
+    Each page is written as soon as it arrives, so the first records hit
+    disk before the full export has been fetched. Output is equivalent to
+    `write_json_safe(path, [record for page in pages for record in page])`.
+    """
+    for _ in tee_json(path, pages):
+        pass
+    return path
+
+
+def tee_json(path: str, pages: Iterable[List[Any]]) -> Iterator[List[Any]]:
+    """
+    Yield `pages` unchanged while writing their records to `path` as one
+    JSON array (the JSON counterpart of tee_jsonl).
+
+    The file is moved into place once `pages` is exhausted; if iteration
+    stops early the partial `<path>.tmp` is removed.
+    """
+    tmp = _tmp_path(path)
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as fh:
+            yield from _json_array_pages(fh, pages)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+
+def write_json_csv_stream(
+    json_path: str,
+    csv_path: str,
+    pages: Iterable[List[Dict[str, Any]]],
+    trailing: Iterable[str] = (),
+) -> None:
+    """
+    Stream pages of flat dicts into a JSON array and a CSV file in one pass.
+
+    Same output as `write_json_stream` + `write_csv_spooled`, but `pages`
+    is only iterated once and no page is kept after both sinks have it.
+    Columns named in `trailing` come last in the CSV.
+    """
+    tmp = _tmp_path(json_path)
+    with open(tmp, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as fh:
+        write_csv_spooled(
+            csv_path,
+            (row for page in _json_array_pages(fh, pages) for row in page),
+            trailing=trailing,
+        )
+    os.replace(tmp, json_path)
+
+
+def _jsonl_line(record: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def tee_jsonl(
+    path: str,
+    pages: Iterable[List[Any]],
+    records: Optional[Callable[[List[Any]], Iterable[Any]]] = None,
+) -> Iterator[List[Any]]:
+    """
+    Yield `pages` unchanged while writing their records to `path` as
+    JSON Lines (one compact JSON document per line).
+
+    Lets a JSONL file be produced alongside another sink in the same
+    pass. `records(page)`, if given, picks what is written for a page
+    (default: the page's items). The file is moved into place once
+    `pages` is exhausted; if iteration stops early the partial
+    `<path>.tmp` is removed.
+    """
+    tmp = _tmp_path(path)
+    try:
+        with open(tmp, "wb", buffering=_WRITE_BUFFER) as fh:
+            for page in pages:
+                fh.writelines(map(_jsonl_line, records(page) if records else page))
+                yield page
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    os.replace(tmp, path)
+
+
+def write_jsonl_stream(path: str, pages: Iterable[List[Any]]) -> str:
+    """
+    Stream pages of records into a JSON Lines file.
+
+    Unlike a JSON array, the output can be consumed line by line
+    (`jq -c`, `for line in fh: json.loads(line)`) in constant memory.
+    """
+    for _ in tee_jsonl(path, pages):
+        pass
+    return path
+
+
+def write_csv_stream(
+    path: str,
+    pages: Iterable[List[Dict[str, Any]]],
+    fieldnames: Optional[List[str]] = None,
+) -> str:
+    """
+    Stream pages of flat dicts into a CSV file.
+
+    The header is `fieldnames` when given (written up front, so even an
+    empty stream yields a header row), otherwise it is taken from the
+    first non-empty page (ordered union of its keys). Columns outside the
+    header cannot be added once it is written; they are dropped and logged
+    once. Use `write_csv_safe` when the full column set must be discovered
+    first.
+    """
+    tmp = _tmp_path(path)
+    with open(tmp, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER) as fh:
+        writer = None
+        known: set = set()
+
+        if fieldnames is not None:
+            known = set(fieldnames)
+            writer = csv.writer(fh)
+            writer.writerow(fieldnames)
+
+        for page in pages:
+            if not page:
+                continue
+
+            if writer is None:
+                fieldnames = _csv_fieldnames(page)
+                known = set(fieldnames)
+                writer = csv.writer(fh)
+                writer.writerow(fieldnames)
+
+            for row in page:
+                if not row.keys() <= known:
+                    extra = row.keys() - known
+                    known.update(extra)  # warn once per column
+                    logger.warning(
+                        "CSV stream %s: dropping columns not in header: %s",
+                        path, ", ".join(sorted(extra)),
+                    )
+            writer.writerows(_csv_values(page, fieldnames))
+
+    os.replace(tmp, path)
+    return path
+
+
+# ======================================================================
+# PIPELINING
+# ======================================================================
+
+_PREFETCH_DONE = object()
+
+
+def prefetch(iterable: Iterable[Any], depth: int = 2) -> Iterator[Any]:
+    """
+    Iterate `iterable` on a background thread, keeping up to `depth`
+    items buffered ahead of the consumer.
+
+    Used by export paths to overlap network and disk: while page N is
+    being flattened and written, page N+1 is already being fetched.
+    Exceptions raised by the producer are re-raised in the consumer.
+    """
+    buf: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def _produce():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                buf.put((item, None))
+        except BaseException as exc:  # re-raised on the consumer side
+            buf.put((_PREFETCH_DONE, exc))
+            return
+        buf.put((_PREFETCH_DONE, None))
+
+    worker = threading.Thread(target=_produce, name="pytenable-was-prefetch", daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item, exc = buf.get()
+            if item is _PREFETCH_DONE:
+                if exc is not None:
+                    raise exc
+                return
+            yield item
+    finally:
+        stop.set()
+        # unblock a producer waiting on a full queue
+        while worker.is_alive():
+            try:
+                buf.get_nowait()
+            except queue.Empty:
+                worker.join(timeout=0.05)
+
+
+def bounded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 16,
+) -> List[Any]:
+    """
+    Apply `func` to every item using up to `max_workers` threads.
+
+    Results are returned in input order. Intended for fanning out
+    independent, I/O-bound API calls over the HTTPClient's pooled
+    session (N sequential round trips become ~N / max_workers).
+    `func` should handle its own per-item errors; an unhandled exception
+    is re-raised here.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(i) for i in items]
+
+    workers = min(max_workers, len(items))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pytenable-was") as pool:
+        return list(pool.map(func, items))
+
+
+def bounded_imap(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 16,
+) -> Iterator[Any]:
+    """
+    Lazy bounded_map: yield `func(item)` results in input order while
+    keeping at most `max_workers` calls in flight.
+
+    Suited to streaming pipelines, where results should be consumed (and
+    released) as they arrive instead of collected into one list.
+    """
+    it = iter(items)
+    if max_workers <= 1:
+        for item in it:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pytenable-was") as pool:
+        window = deque(pool.submit(func, i) for i in itertools.islice(it, max_workers))
+        while window:
+            future = window.popleft()
+            for item in itertools.islice(it, 1):
+                window.append(pool.submit(func, item))
+            yield future.result()
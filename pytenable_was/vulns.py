@@ -6,27 +6,32 @@ Tenable WAS v2 Vulnerabilities Module (Rewritten)
 Supports:
     • Search vulnerabilities via /was/v2/vulns/search
     • Retrieve a single vulnerability via /was/v2/vulns/{vuln_id}
-    • Export ALL vulnerabilities (search-all with pagination)
-    • Flattened CSV/JSON exports
+    • Export ALL vulnerabilities (search-all, pages fetched concurrently)
+    • Page-by-page iteration for streaming exports
+    • Flattened CSV/JSON/JSON Lines exports (streamed to disk while fetching)
     • Progress bars via tqdm
 
 Designed to work with the rewritten utils.py for:
-    - flatten_dict
-    - write_json_safe
-    - write_csv_safe
+    - flatten_dicts
+    - prefetch
+    - tee_json / tee_jsonl
+    - write_csv_spooled
     - timestamp_filename
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from tqdm import tqdm
 
 from .errors import TenableAPIError
 from .utils import (
-    flatten_dict,
-    write_json_safe,
-    write_csv_safe,
+    bounded_imap,
+    flatten_dicts,
+    prefetch,
+    tee_json,
+    tee_jsonl,
+    write_csv_spooled,
     timestamp_filename,
 )
 
@@ -139,10 +144,18 @@ class VulnsAPI:
             raise TenableAPIError("Malformed vulns.search payload: 'items' missing or invalid")
         return items
 
-    def search_all(self, query: str = "*", page_size: int = 1000) -> List[Dict[str, Any]]:
+    def iter_search_pages(
+        self,
+        query: str = "*",
+        page_size: int = 1000,
+        max_workers: int = 8,
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Retrieve ALL vulnerabilities matching the query by paging through
-        /was/v2/vulns/search until all results are collected.
+        Page through /was/v2/vulns/search, yielding each page of
+        vulnerability objects as soon as it is received.
+
+        A tqdm progress bar is shown when the result spans more than
+        one page.
 
         Parameters
         ----------
@@ -150,11 +163,14 @@ class VulnsAPI:
             Vulnerability search query. Default '*' returns all accessible vulns.
         page_size : int
             Number of vulns to fetch per API call.
+        max_workers : int
+            Pages requested concurrently once the first page has reported
+            the total (results are still yielded in order).
 
-        Returns
-        -------
+        Yields
+        ------
         List[dict]
-            Complete list of vulnerability objects.
+            One page of vulnerability objects.
         """
         # First request: determine total & first page of data
         first = self._api_search(query=query, limit=page_size, offset=0)
@@ -165,12 +181,12 @@ class VulnsAPI:
         if not isinstance(items, list):
             raise TenableAPIError("Malformed payload: 'items' not a list in first search page")
 
-        results: List[Dict[str, Any]] = []
-        results.extend(items)
+        if items:
+            yield items
 
         if total <= len(items):
             # all results returned in first page
-            return results
+            return
 
         # Progress bar over total vulns; start from first page count
         pbar = tqdm(
@@ -180,29 +196,49 @@ class VulnsAPI:
             unit="vuln",
         )
 
-        offset = len(items)
-        while offset < total:
-            page = self._api_search(query=query, limit=page_size, offset=offset)
-            page_items = page.get("items", [])
-            if not page_items:
-                # no more or malformed; break to avoid infinite loop
-                break
+        # The total is known now, so the remaining offsets can be requested
+        # concurrently. The first page's length is the page size the server
+        # actually honours (it may cap `page_size`).
+        step = len(items)
+        if not step:
+            pbar.close()
+            return
 
-            results.extend(page_items)
-            pbar.update(len(page_items))
+        def _page(offset):
+            page = self._api_search(query=query, limit=step, offset=offset)
+            page_items = page.get("items", [])
+            if not isinstance(page_items, list):
+                raise TenableAPIError("Malformed payload: 'items' not a list in search page")
+            return page_items
 
-            # update offset based on server pagination if present
-            pagination = page.get("pagination") or {}
-            server_offset = pagination.get("offset")
-            server_limit = pagination.get("limit")
+        try:
+            for page_items in bounded_imap(_page, range(step, total, step), max_workers=max_workers):
+                if page_items:
+                    pbar.update(len(page_items))
+                    yield page_items
+        finally:
+            pbar.close()
 
-            if server_offset is not None and server_limit:
-                offset = server_offset + server_limit
-            else:
-                offset += len(page_items)
+    def search_all(self, query: str = "*", page_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Retrieve ALL vulnerabilities matching the query by paging through
+        /was/v2/vulns/search until all results are collected.
 
-        pbar.close()
+        Parameters
+        ----------
+        query : str
+            Vulnerability search query. Default '*' returns all accessible vulns.
+        page_size : int
+            Number of vulns to fetch per API call.
 
+        Returns
+        -------
+        List[dict]
+            Complete list of vulnerability objects.
+        """
+        results: List[Dict[str, Any]] = []
+        for page in self.iter_search_pages(query=query, page_size=page_size):
+            results.extend(page)
         return results
 
     def get_vuln(self, vuln_id: str) -> Dict[str, Any]:
@@ -219,17 +255,48 @@ class VulnsAPI:
         """
         Flatten a list of vulnerability objects for CSV or dataframe usage.
         """
-        return [flatten_dict(v) for v in vulns]
+        return list(flatten_dicts(vulns))
 
     # ----------------------------------------------------------------------
     # EXPORT-ALL FILE WRITERS
     # ----------------------------------------------------------------------
 
+    def export_all_vulns(
+        self,
+        query: str = "*",
+        json_path: Optional[str] = None,
+        jsonl_path: Optional[str] = None,
+        csv_path: Optional[str] = None,
+        page_size: int = 1000,
+        max_workers: int = 8,
+    ) -> None:
+        """
+        Export all vulnerabilities matching the query to every given file
+        from a single search.
+
+        json_path / jsonl_path receive the raw vulnerabilities, csv_path
+        the flattened rows (header covering every column, spooled so memory
+        use does not grow with the result size). Page N is written while
+        page N+1 is fetched in the background.
+        """
+        pages = prefetch(self.iter_search_pages(query=query, page_size=page_size, max_workers=max_workers))
+        if json_path:
+            pages = tee_json(json_path, pages)
+        if jsonl_path:
+            pages = tee_jsonl(jsonl_path, pages)
+
+        if csv_path:
+            write_csv_spooled(csv_path, (row for page in pages for row in self.flatten_vulns(page)))
+        else:
+            for _ in pages:
+                pass
+
     def export_all_vulns_json(
         self,
         path: Optional[str] = None,
         query: str = "*",
         page_size: int = 1000,
+        max_workers: int = 8,
     ) -> str:
         """
         Export all vulnerabilities matching the query to a JSON file.
@@ -240,8 +307,27 @@ class VulnsAPI:
         if path is None:
             path = timestamp_filename(prefix="vulns_all", ext="json")
 
-        vulns = self.search_all(query=query, page_size=page_size)
-        write_json_safe(path, vulns)
+        self.export_all_vulns(query, json_path=path, page_size=page_size, max_workers=max_workers)
+        return path
+
+    def export_all_vulns_jsonl(
+        self,
+        path: Optional[str] = None,
+        query: str = "*",
+        page_size: int = 1000,
+        max_workers: int = 8,
+    ) -> str:
+        """
+        Export all vulnerabilities matching the query to a JSON Lines file
+        (one vulnerability per line).
+
+        If path is None, generates:
+            vulns_all_<timestamp>.jsonl
+        """
+        if path is None:
+            path = timestamp_filename(prefix="vulns_all", ext="jsonl")
+
+        self.export_all_vulns(query, jsonl_path=path, page_size=page_size, max_workers=max_workers)
         return path
 
     def export_all_vulns_csv(
@@ -249,6 +335,7 @@ class VulnsAPI:
         path: Optional[str] = None,
         query: str = "*",
         page_size: int = 1000,
+        max_workers: int = 8,
     ) -> str:
         """
         Export all vulnerabilities matching the query to a flattened CSV file.
@@ -259,7 +346,5 @@ class VulnsAPI:
         if path is None:
             path = timestamp_filename(prefix="vulns_all", ext="csv")
 
-        vulns = self.search_all(query=query, page_size=page_size)
-        flat = self.flatten_vulns(vulns)
-        write_csv_safe(path, flat)
+        self.export_all_vulns(query, csv_path=path, page_size=page_size, max_workers=max_workers)
         return path
@@ -0,0 +1,70 @@
+import pytest
+
+from pytenable_was.cache import DiskCache, InMemoryCache
+
+
+def test_in_memory_cache_roundtrip_and_miss():
+    cache = InMemoryCache()
+    cache.set("notes", "s1", [1, 2])
+    assert cache.get("notes", "s1") == [1, 2]
+
+    with pytest.raises(KeyError):
+        cache.get("notes", "missing")
+
+
+def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(maxsize=2)
+    cache.set("notes", "a", 1)
+    cache.set("notes", "b", 2)
+    cache.get("notes", "a")
+    cache.set("notes", "c", 3)
+
+    assert cache.get("notes", "a") == 1
+    with pytest.raises(KeyError):
+        cache.get("notes", "b")
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    DiskCache(path).set("findings_export", "s1", [{"id": 1}])
+
+    assert DiskCache(path).get("findings_export", "s1") == [{"id": 1}]
+
+    with pytest.raises(KeyError):
+        DiskCache(path).get("findings_export", "s2")
+
+
+def test_disk_cache_expired_entries_readable_as_stale(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    cache.set("plugins", "/was/v2/plugins/1", {"id": 1}, ttl=-1)
+
+    with pytest.raises(KeyError):
+        cache.get("plugins", "/was/v2/plugins/1")
+    assert cache.get("plugins", "/was/v2/plugins/1", stale=True) == {"id": 1}
+
+
+def test_disk_cache_prune_keeps_newest(tmp_path, monkeypatch):
+    clock = iter(range(100))
+    monkeypatch.setattr("pytenable_was.cache.time.time", lambda: next(clock))
+
+    cache = DiskCache(tmp_path / "cache.sqlite3")
+    for key in ("s1", "s2", "s3"):
+        cache.set("findings_export", key, [])
+    cache.set("notes", "s1", [])
+    cache.prune("findings_export", 2)
+
+    with pytest.raises(KeyError):
+        cache.get("findings_export", "s1")
+    assert cache.get("findings_export", "s3") == []
+    assert cache.get("notes", "s1") == []
+
+
+def test_disk_cache_files_are_private(tmp_path):
+    cache = DiskCache(tmp_path / "sub" / "cache.sqlite3")
+    cache.set("scans", "s1", {"a": 1})
+
+    assert (tmp_path / "sub").stat().st_mode & 0o777 == 0o700
+    for name in ("cache.sqlite3", "cache.sqlite3-wal", "cache.sqlite3-shm"):
+        path = tmp_path / "sub" / name
+        if path.exists():
+            assert path.stat().st_mode & 0o777 == 0o600
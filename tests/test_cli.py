@@ -15,3 +15,14 @@ def test_cli_help():
     assert "Usage" in out
     for cmd in ["config", "scans", "templates", "user-templates"]:
         assert cmd in out
+
+def test_cli_loads_in_process():
+    # Catches import-time errors in command definitions (bad option kwargs,
+    # missing modules) without depending on the installed entry point.
+    from click.testing import CliRunner
+    from pytenable_was.cli import cli
+
+    result = CliRunner().invoke(cli, ["--help"])
+    assert result.exit_code == 0, result.output
+    for group in ["scans", "findings", "vulns", "plugins", "notes"]:
+        assert group in result.output
@@ -1,18 +1,36 @@
-from pytenable_was.config import Config
+import stat
+
+from pytenable_was import config as config_mod
+from pytenable_was.config import load_config, save_config
+
 
 def test_config_cycle(tmp_path, monkeypatch):
-    cfg_file = tmp_path / "config.json"
-    monkeypatch.setattr(Config, "CONFIG_FILE", cfg_file)
+    monkeypatch.setattr(config_mod, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_mod, "CONFIG_FILE", tmp_path / "config.json")
+
+    assert load_config() == config_mod._default_config()
+
+    cfg = load_config()
+    cfg.update(api_key="A1", proxy_url="http://proxy")
+    save_config(cfg)
+
+    loaded = load_config()
+    assert loaded["api_key"] == "A1"
+    assert loaded["proxy_url"] == "http://proxy"
+
+    save_config(config_mod._default_config())
+    assert load_config() == config_mod._default_config()
+
+
+def test_save_config_atomic_and_private(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_mod, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(config_mod, "CONFIG_FILE", tmp_path / "config.json")
 
-    cfg = Config()
-    cfg.set_access_key("A1")
-    cfg.set_secret_key("B2")
-    cfg.set_proxy("http://proxy")
+    # leftover temp file from an interrupted save must not block the next one
+    (tmp_path / "config.tmp").write_text("{")
 
-    loaded = cfg.load()
-    assert loaded["access_key"] == "A1"
-    assert loaded["secret_key"] == "B2"
-    assert loaded["proxy"] == "http://proxy"
+    save_config({"api_key": "K"})
 
-    cfg.clear()
-    assert cfg.load() == {}
+    assert load_config() == {"api_key": "K"}
+    assert not (tmp_path / "config.tmp").exists()
+    assert stat.S_IMODE((tmp_path / "config.json").stat().st_mode) == 0o600
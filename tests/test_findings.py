@@ -0,0 +1,58 @@
+import json
+
+from pytenable_was.findings import FindingsAPI
+
+
+class _FakeScans:
+    def list_scans(self):
+        return [{"scan_id": str(i), "status": "completed"} for i in range(20)]
+
+
+def test_export_all_does_not_retain_findings_in_memory(tmp_path):
+    api = FindingsAPI(http=None, scans_api=_FakeScans())
+    api._api_export_findings = lambda scan_id: {
+        "findings": [{"finding_id": f"{scan_id}-{n}", "severity": "low"} for n in range(1000)]
+    }
+
+    api.export_all_findings_csv(str(tmp_path / "all.csv"))
+    api.export_all_findings_jsonl(str(tmp_path / "all.jsonl"))
+
+    assert len(api.cache._data) == 0
+    with open(tmp_path / "all.csv", encoding="utf-8") as fh:
+        assert sum(1 for _ in fh) == 20 * 1000 + 1
+
+
+def test_export_all_files_fetches_each_scan_once(tmp_path):
+    api = FindingsAPI(http=None, scans_api=_FakeScans())
+    fetched = []
+
+    def export(scan_id):
+        fetched.append(scan_id)
+        return {"findings": [{"finding_id": f"{scan_id}-0", "severity": "low"}]}
+
+    api._api_export_findings = export
+    api.export_all_findings_files(
+        json_path=str(tmp_path / "all.json"),
+        jsonl_path=str(tmp_path / "all.jsonl"),
+        csv_path=str(tmp_path / "all.csv"),
+    )
+
+    assert sorted(fetched, key=int) == [str(i) for i in range(20)]
+    with open(tmp_path / "all.json", encoding="utf-8") as fh:
+        assert json.load(fh)[3] == {"scan_id": "3", "findings": [{"finding_id": "3-0", "severity": "low"}]}
+    with open(tmp_path / "all.jsonl", encoding="utf-8") as fh:
+        assert json.loads(fh.readline()) == {"finding_id": "0-0", "severity": "low", "scan_id": "0"}
+    with open(tmp_path / "all.csv", encoding="utf-8") as fh:
+        assert fh.readline().strip() == "finding_id,severity,scan_id"
+
+
+def test_group_by_severity_matches_utils_buckets():
+    api = FindingsAPI(http=None, scans_api=_FakeScans())
+    api._api_get_findings = lambda scan_id: {
+        "findings": [{"finding_id": 1, "severity": "High"}, {"finding_id": 2}, {"finding_id": 3, "severity": "odd"}]
+    }
+
+    groups = api.group_by_severity("s1")
+    assert list(groups) == ["critical", "high", "medium", "low", "info", "unknown"]
+    assert [f["finding_id"] for f in groups["high"]] == [1]
+    assert [f["finding_id"] for f in groups["unknown"]] == [2, 3]
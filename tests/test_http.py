@@ -1,22 +1,21 @@
+import pytest
 from unittest.mock import patch
 from pytenable_was.http import HTTPClient
 from pytenable_was.errors import TenableAPIError
 
 def test_http_headers(http_client):
     headers = http_client._headers()
-    assert "X-ApiKeys" in headers
-    assert "AK" in headers["X-ApiKeys"]
-    assert "SK" in headers["X-ApiKeys"]
+    assert headers["X-API-Key"] == "AK"
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_http_retry(mock_req, http_client):
     mock_req.return_value.status_code = 200
-    mock_req.return_value.json.return_value = {"ok": True}
+    mock_req.return_value.content = b'{"ok": true}'
 
     resp = http_client.get("/test")
     assert resp == {"ok": True}
 
-@patch("requests.request")
+@patch("requests.Session.request")
 def test_http_error(mock_req, http_client):
     mock_req.return_value.status_code = 500
     mock_req.return_value.text = "ERR"
@@ -26,3 +25,147 @@ def test_http_error(mock_req, http_client):
         assert False, "Should not reach"
     except TenableAPIError:
         pass
+
+@patch("requests.Session.request")
+def test_http_reuses_session(mock_req, http_client):
+    mock_req.return_value.status_code = 200
+    mock_req.return_value.content = b'{"ok": true}'
+
+    http_client.get("/a")
+    http_client.get("/b")
+    assert mock_req.call_count == 2
+    for call in mock_req.call_args_list:
+        assert call.kwargs["headers"] is http_client._headers()
+
+@patch("pytenable_was.http.time.sleep")
+@patch("requests.Session.request")
+def test_http_429_honors_retry_after(mock_req, mock_sleep, http_client):
+    throttled = type("R", (), {"status_code": 429, "headers": {"Retry-After": "7"}})()
+    ok = type("R", (), {"status_code": 200, "headers": {}, "content": b'{"ok": true}'})()
+    mock_req.side_effect = [throttled, ok]
+
+    assert http_client.get("/test") == {"ok": True}
+    delay = mock_sleep.call_args[0][0]
+    assert 7 <= delay <= 7.5
+
+@patch("requests.Session.request")
+def test_http_etag_revalidation(mock_req, http_client):
+    fresh = type("R", (), {
+        "status_code": 200,
+        "headers": {"ETag": '"v1"'},
+        "content": b'{"items": [1]}',
+    })()
+    not_modified = type("R", (), {"status_code": 304, "headers": {}})()
+    mock_req.side_effect = [fresh, not_modified]
+
+    assert http_client.get("/cached") == {"items": [1]}
+    assert http_client.get("/cached") == {"items": [1]}
+    assert mock_req.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+@patch("requests.Session.request")
+def test_http_get_full_passes_validators_and_304(mock_req, http_client):
+    mock_req.return_value = type("R", (), {"status_code": 304, "headers": {"ETag": '"v1"'}, "content": b""})()
+
+    status, headers, data = http_client.get_full("/plugins", headers={"If-None-Match": '"v1"'})
+    assert (status, headers["ETag"], data) == (304, '"v1"', None)
+    assert mock_req.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+@patch("requests.Session.request")
+def test_http_get_memo_and_invalidation(mock_req, http_client):
+    mock_req.return_value.status_code = 200
+    mock_req.return_value.content = b'{"ok": true}'
+    http_client.GET_CACHE_TTL = 30
+
+    first = http_client.get("/memo")
+    first["mutated"] = True
+    assert http_client.get("/memo") == {"ok": True}
+    assert mock_req.call_count == 1
+
+    http_client.patch("/memo", json={})
+    http_client.get("/memo")
+    assert mock_req.call_count == 3
+
+
+@patch("requests.Session.request")
+def test_http_get_memo_off_by_default(mock_req, http_client):
+    mock_req.return_value.status_code = 200
+    mock_req.return_value.content = b'{"status": "running"}'
+
+    http_client.get("/scans/s1")
+    http_client.get("/scans/s1")
+    assert mock_req.call_count == 2
+
+@patch("pytenable_was.http.time.sleep")
+@patch("requests.Session.request")
+def test_http_429_full_jitter_then_throttle_error(mock_req, mock_sleep, http_client):
+    from pytenable_was.errors import ThrottleError
+
+    mock_req.return_value = type("R", (), {"status_code": 429, "headers": {}})()
+    http_client._throttle = None  # only the retry sleeps are under test
+
+    with pytest.raises(ThrottleError):
+        http_client.get("/busy")
+
+    delays = [c[0][0] for c in mock_sleep.call_args_list]
+    assert len(delays) == http_client.THROTTLE_RETRIES
+    for n, delay in enumerate(delays):
+        assert 0 <= delay <= min(http_client.THROTTLE_BACKOFF_CAP, 2 ** n)
+
+def test_admission_throttle_adapts():
+    from pytenable_was.http import _AdmissionThrottle
+
+    bucket = _AdmissionThrottle(rate=8, burst=8, min_rate=1, recover_after=2)
+    bucket.penalize()
+    bucket.penalize()
+    assert bucket.rate == 2
+
+    bucket.recover()
+    bucket.recover()
+    assert bucket.rate == 4
+
+@patch("requests.Session.request")
+def test_http_stream_copies_chunks_to_sink(mock_req, http_client):
+    import io
+
+    mock_req.return_value.status_code = 200
+    mock_req.return_value.iter_content.return_value = [b'{"findings":', b"", b" []}"]
+    sink = io.BytesIO()
+
+    assert http_client.stream("POST", "/was/v2/export/findings", sink, json={"scan_id": "s"}) == 16
+    assert sink.getvalue() == b'{"findings": []}'
+    assert mock_req.call_args.kwargs["stream"] is True
+    mock_req.return_value.close.assert_called_once()
+
+@patch("pytenable_was.http.time.sleep")
+def test_http_429_retried_only_by_client_loop(mock_sleep, http_client):
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from pytenable_was.errors import ThrottleError
+
+    hits = []
+
+    class Always429(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Always429)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        http_client.BASE_URL = f"http://127.0.0.1:{server.server_port}"
+        http_client.session.trust_env = False  # never route localhost via a proxy
+        http_client._throttle = None
+
+        with pytest.raises(ThrottleError):
+            http_client.get("/busy")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(hits) == http_client.THROTTLE_RETRIES + 1
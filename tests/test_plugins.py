@@ -0,0 +1,32 @@
+from pytenable_was.plugins import PluginsAPI
+
+def test_plugins_api_initialization(http_client):
+    api = PluginsAPI(http_client)
+    assert hasattr(api, "get_multiple")
+    assert hasattr(api, "flatten_multiple")
+    assert PluginsAPI.flatten_multi is PluginsAPI.flatten_multiple
+
+def test_compiled_flattener_matches_generic(monkeypatch):
+    record = {"plugin_id": 98000, "risk_factor": "high", "cwe": ["79", 80], "cvss": {"base": 5.0}, "updated": None}
+
+    compiled = PluginsAPI(None)._flatten_object(record)
+    monkeypatch.setattr("pytenable_was.plugins._MAX_COMPILED_FLATTENERS", 0)
+    generic = PluginsAPI(None)._flatten_object(record)
+
+    assert compiled == generic
+    assert compiled["cwe"] == "79, 80" and compiled["updated"] is None
+
+def test_batch_disabled_when_filter_ignored():
+    api = PluginsAPI(None)
+    api.BATCH_SIZE = 2
+    calls = []
+
+    def ignore_filter(ids):
+        calls.append(ids)
+        return [{"plugin_id": 1}, {"plugin_id": 2}]
+
+    api.get_batch = ignore_filter
+
+    assert api._get_batched(["10", "11", "12", "13"]) == {}
+    assert calls == [["10", "11"]]
+    assert api._batch_supported is False
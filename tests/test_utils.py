@@ -1,6 +1,9 @@
 # tests/test_utils.py
 
-import math
+import json
+
+import pytest
+
 from pytenable_was.utils import (
     normalize_id,
     normalize_url,
@@ -14,8 +17,19 @@ from pytenable_was.utils import (
     sort_by_severity,
     group_by_severity,
     flatten_dict,
+    flatten_dicts,
+    flatten_keys,
     flatten_model,
     pretty_json,
+    prefetch,
+    bounded_map,
+    bounded_imap,
+    write_csv_columns,
+    write_csv_spooled,
+    write_csv_stream,
+    write_json_csv_stream,
+    write_json_stream,
+    write_jsonl_stream,
 )
 
 
@@ -117,6 +131,29 @@ def test_flatten_dict_simple():
     assert flat == {"a.b": 1, "a.c.d": 2, "x": 3}
 
 
+def test_flatten_keys_matches_flatten_dict():
+    data = {"a": {"b": 1, "c": {"d": 2}}, "x": 3}
+    assert list(flatten_keys(data)) == list(flatten_dict(data))
+
+
+def test_flatten_dicts_matches_flatten_dict():
+    rows = [
+        {"a": {"b": 1, "c": {"d": 2}}, "x": 3},
+        {"a": {"b": 4, "c": {"d": 5}}, "x": 6},
+        {"a": {"b": 7, "c": None}, "x": 8},        # sub-object null
+        {"a": {"b": 9, "c": {"d": 1}}, "x": {"y": 2}},  # scalar became dict
+        {"a": {"b": 1, "e": {"d": 2}}, "x": 3},     # same size, other key
+        {"a": {"b": 1}},
+    ]
+    assert [list(r.items()) for r in flatten_dicts(rows)] == [list(flatten_dict(r).items()) for r in rows]
+
+    # same shape, other key order: equal, keys in the first record's order
+    reordered = [{"a": 1, "b": {"c": 2}}, {"b": {"c": 3}, "a": 4}]
+    flat = list(flatten_dicts(reordered))
+    assert flat == [flatten_dict(r) for r in reordered]
+    assert list(flat[1]) == ["a", "b.c"]
+
+
 def test_flatten_model_with_dict():
     data = {"a": {"b": 1}}
     flat = flatten_model(data)
@@ -140,12 +177,8 @@ def test_flatten_model_invalid():
     class NotModel:
         pass
 
-    try:
+    with pytest.raises(ValueError):
         flatten_model(NotModel())
-    except ValueError:
-        assert True
-    else:
-        assert False, "Expected ValueError for invalid flatten_model input"
 
 
 def test_pretty_json():
@@ -163,3 +196,71 @@ def test_pretty_json():
     out2 = pretty_json(x)
     # Just make sure it doesn't crash and returns something
     assert isinstance(out2, str)
+
+
+def test_prefetch_preserves_order_and_errors():
+    assert list(prefetch(iter([[1], [2], [3]]))) == [[1], [2], [3]]
+
+    def broken():
+        yield [1]
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        list(prefetch(broken()))
+
+
+def test_write_stream_helpers(tmp_path):
+    pages = [[{"a": 1, "b": 2}], [{"a": 3}]]
+
+    json_path = write_json_stream(str(tmp_path / "out.json"), iter(pages))
+    with open(json_path, encoding="utf-8") as fh:
+        assert json.load(fh) == [{"a": 1, "b": 2}, {"a": 3}]
+
+    csv_path = write_csv_stream(str(tmp_path / "out.csv"), iter(pages))
+    with open(csv_path, encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["a,b", "1,2", "3,"]
+
+    write_csv_stream(str(tmp_path / "fixed.csv"), iter(pages), fieldnames=["b", "c"])
+    with open(tmp_path / "fixed.csv", encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["b,c", "2,", ","]
+
+    late = [[{"a": 1}], [{"a": 3, "b": 4}]]
+    write_json_csv_stream(str(tmp_path / "both.json"), str(tmp_path / "both.csv"), iter(late))
+    with open(tmp_path / "both.json", encoding="utf-8") as fh:
+        assert json.load(fh) == [{"a": 1}, {"a": 3, "b": 4}]
+    with open(tmp_path / "both.csv", encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["a,b", "1,", "3,4"]
+
+    write_json_csv_stream(str(tmp_path / "t.json"), str(tmp_path / "t.csv"), iter(late), trailing=["a"])
+    with open(tmp_path / "t.csv", encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["b,a", ",1", "4,3"]
+
+    jsonl_path = write_jsonl_stream(str(tmp_path / "out.jsonl"), iter(pages))
+    with open(jsonl_path, encoding="utf-8") as fh:
+        assert [json.loads(line) for line in fh] == [{"a": 1, "b": 2}, {"a": 3}]
+
+    write_csv_spooled(str(tmp_path / "spool.csv"), iter([{"id": 1}, {"id": 2, "x": True}]), trailing=["id"])
+    with open(tmp_path / "spool.csv", encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["x,id", ",1", "True,2"]
+
+    write_csv_columns(str(tmp_path / "cols.csv"), {"a": [1, 3], "b": [2, None]})
+    with open(tmp_path / "cols.csv", encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["a,b", "1,2", "3,"]
+
+
+def test_bounded_map_keeps_input_order():
+    assert bounded_map(lambda x: x * 2, [3, 1, 2], max_workers=4) == [6, 2, 4]
+    assert bounded_map(lambda x: x, []) == []
+
+
+def test_bounded_imap_is_lazy_and_ordered():
+    seen = []
+
+    def work(x):
+        seen.append(x)
+        return x * 2
+
+    results = bounded_imap(work, range(100), max_workers=2)
+    assert next(results) == 0
+    assert len(seen) < 100
+    assert list(results) == [x * 2 for x in range(1, 100)]
@@ -0,0 +1,39 @@
+import json
+
+from pytenable_was.vulns import VulnsAPI
+
+def test_export_all_vulns_csv_keeps_columns_from_later_pages(tmp_path):
+    api = VulnsAPI(None)
+    api.iter_search_pages = lambda **kwargs: iter([
+        [{"id": 1, "name": "a"}],
+        [{"id": 2, "cvss": {"score": 5}}],
+    ])
+
+    path = api.export_all_vulns_csv(str(tmp_path / "vulns.csv"))
+
+    with open(path, encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["id,name,cvss.score", "1,a,", "2,,5"]
+
+
+def test_export_all_vulns_fetches_once_for_every_output(tmp_path):
+    api = VulnsAPI(None)
+    calls = []
+
+    def pages(**kwargs):
+        calls.append(kwargs)
+        return iter([[{"id": 1, "plugin": {"name": "XSS"}}], [{"id": 2}]])
+
+    api.iter_search_pages = pages
+    api.export_all_vulns(
+        json_path=str(tmp_path / "v.json"),
+        jsonl_path=str(tmp_path / "v.jsonl"),
+        csv_path=str(tmp_path / "v.csv"),
+    )
+
+    assert len(calls) == 1
+    with open(tmp_path / "v.json", encoding="utf-8") as fh:
+        assert json.load(fh) == [{"id": 1, "plugin": {"name": "XSS"}}, {"id": 2}]
+    with open(tmp_path / "v.jsonl", encoding="utf-8") as fh:
+        assert [json.loads(line) for line in fh] == [{"id": 1, "plugin": {"name": "XSS"}}, {"id": 2}]
+    with open(tmp_path / "v.csv", encoding="utf-8") as fh:
+        assert fh.read().splitlines() == ["id,plugin.name", "1,XSS", "2,"]